@@ -4,20 +4,123 @@ Professional PWD-themed tools with enhanced styling
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-from datetime import datetime, date
+import importlib
 import os
 import sys
 
-# Add tools directories to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'tools'))
-sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
+# Add tools directories to path (once; Streamlit re-executes this module)
+for _path in (os.path.join(os.path.dirname(__file__), 'tools'),
+              os.path.join(os.path.dirname(__file__), 'utils')):
+    if _path not in sys.path:
+        sys.path.append(_path)
 
-# Import tool modules
-from tools.financial import bill_note_sheet, emd_refund, security_refund, financial_progress, hindi_bill_generator
-from tools.calculation import delay_calculator, stamp_duty_calculator, deductions_table, excel_emd_processor
-from tools.reports import bill_deviation_generator, financial_analysis
+# Tool modules, imported on demand so a rerun only loads the selected tool
+FINANCIAL_TOOLS = {
+    "Bill Note Sheet": "tools.financial.bill_note_sheet",
+    "EMD Refund": "tools.financial.emd_refund",
+    "Security Refund": "tools.financial.security_refund",
+    "Financial Progress": "tools.financial.financial_progress",
+    "Hindi Bill Generator": "tools.financial.hindi_bill_generator",
+}
+
+CALCULATION_TOOLS = {
+    "Delay Calculator": "tools.calculation.delay_calculator",
+    "Stamp Duty Calculator": "tools.calculation.stamp_duty_calculator",
+    "Deductions Table": "tools.calculation.deductions_table",
+    "Excel EMD Processor": "tools.calculation.excel_emd_processor",
+}
+
+REPORT_TOOLS = {
+    "Bill & Deviation Generator": "tools.reports.bill_deviation_generator",
+    "Financial Analysis": "tools.reports.financial_analysis",
+}
+
+# Static HTML blocks, built once at import rather than on every rerun
+HEADER_HTML = """
+<div style="text-align: center; background: linear-gradient(135deg, #FF6B35 0%, #004E89 100%); 
+            padding: 2rem; border-radius: 10px; color: white; margin-bottom: 2rem; 
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+    <h1 style="margin: 0; font-size: 2.5rem; font-weight: 700;">🏗️ PWD Tools - Infrastructure Management Suite</h1>
+    <p style="margin: 0.5rem 0 0 0; font-size: 1.1rem; opacity: 0.9;">
+        Comprehensive tools for Public Works Department operations with enhanced professional styling
+    </p>
+</div>
+"""
+
+CARD_FINANCIAL_HTML = """
+<div style="background: white; border: 2px solid #e9ecef; border-radius: 10px; 
+            padding: 1.5rem; margin: 1rem 0; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); 
+            transition: all 0.3s ease;">
+    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+        <span style="font-size: 2rem; margin-right: 1rem;">💰</span>
+        <h3 style="font-size: 1.5rem; font-weight: 600; color: #004E89; margin: 0;">Financial Tools</h3>
+    </div>
+    <p style="color: #6C757D; margin-bottom: 1rem; font-style: italic;">
+        Essential financial management and documentation tools
+    </p>
+    <div>
+        <strong>5 Tools Available:</strong><br>
+        • Bill Note Sheet<br>
+        • EMD Refund<br>
+        • Security Refund<br>
+        • Financial Progress<br>
+        • Hindi Bill Generator
+    </div>
+</div>
+"""
+
+CARD_CALC_HTML = """
+<div style="background: white; border: 2px solid #e9ecef; border-radius: 10px; 
+            padding: 1.5rem; margin: 1rem 0; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); 
+            transition: all 0.3s ease;">
+    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+        <span style="font-size: 2rem; margin-right: 1rem;">🧮</span>
+        <h3 style="font-size: 1.5rem; font-weight: 600; color: #004E89; margin: 0;">Calculation Tools</h3>
+    </div>
+    <p style="color: #6C757D; margin-bottom: 1rem; font-style: italic;">
+        Advanced calculation and processing utilities
+    </p>
+    <div>
+        <strong>4 Tools Available:</strong><br>
+        • Delay Calculator<br>
+        • Stamp Duty Calculator<br>
+        • Deductions Table<br>
+        • Excel EMD Processor
+    </div>
+</div>
+"""
+
+CARD_REPORT_HTML = """
+<div style="background: white; border: 2px solid #e9ecef; border-radius: 10px; 
+            padding: 1.5rem; margin: 1rem 0; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); 
+            transition: all 0.3s ease;">
+    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+        <span style="font-size: 2rem; margin-right: 1rem;">📊</span>
+        <h3 style="font-size: 1.5rem; font-weight: 600; color: #004E89; margin: 0;">Report Tools</h3>
+    </div>
+    <p style="color: #6C757D; margin-bottom: 1rem; font-style: italic;">
+        Comprehensive reporting and analysis solutions
+    </p>
+    <div>
+        <strong>2 Tools Available:</strong><br>
+        • Bill & Deviation Generator<br>
+        • Financial Analysis
+    </div>
+</div>
+"""
+
+FOOTER_HTML = """
+<div style="background-color: #004E89; color: white; text-align: center; 
+            padding: 2rem; margin-top: 3rem; border-radius: 10px;">
+    <h4 style="margin: 0 0 0.5rem 0; color: #FF6B35;">🏗️ PWD Tools - Infrastructure Management Suite</h4>
+    <p style="margin: 0; opacity: 0.9;">Prepared for Mrs. Premlata Jain, AAO, PWD Udaipur</p>
+    <p style="margin: 0; opacity: 0.9;">Enhanced with professional PWD-themed styling | Version 2.0.0</p>
+</div>
+"""
+
+def run_tool(module_name):
+    """Import a tool module and run its main function"""
+    importlib.import_module(module_name).main()
 
 def set_page_config():
     """Configure page settings with PWD theme"""
@@ -30,16 +133,7 @@ def set_page_config():
 
 def render_header():
     """Render main application header"""
-    st.markdown("""
-        <div style="text-align: center; background: linear-gradient(135deg, #FF6B35 0%, #004E89 100%); 
-                    padding: 2rem; border-radius: 10px; color: white; margin-bottom: 2rem; 
-                    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-            <h1 style="margin: 0; font-size: 2.5rem; font-weight: 700;">🏗️ PWD Tools - Infrastructure Management Suite</h1>
-            <p style="margin: 0.5rem 0 0 0; font-size: 1.1rem; opacity: 0.9;">
-                Comprehensive tools for Public Works Department operations with enhanced professional styling
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 def render_sidebar():
     """Render sidebar with navigation and statistics"""
@@ -101,82 +195,27 @@ def render_dashboard():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown("""
-            <div style="background: white; border: 2px solid #e9ecef; border-radius: 10px; 
-                        padding: 1.5rem; margin: 1rem 0; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); 
-                        transition: all 0.3s ease;">
-                <div style="display: flex; align-items: center; margin-bottom: 1rem;">
-                    <span style="font-size: 2rem; margin-right: 1rem;">💰</span>
-                    <h3 style="font-size: 1.5rem; font-weight: 600; color: #004E89; margin: 0;">Financial Tools</h3>
-                </div>
-                <p style="color: #6C757D; margin-bottom: 1rem; font-style: italic;">
-                    Essential financial management and documentation tools
-                </p>
-                <div>
-                    <strong>5 Tools Available:</strong><br>
-                    • Bill Note Sheet<br>
-                    • EMD Refund<br>
-                    • Security Refund<br>
-                    • Financial Progress<br>
-                    • Hindi Bill Generator
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(CARD_FINANCIAL_HTML, unsafe_allow_html=True)
         
         if st.button("Access Financial Tools", key="btn_financial", use_container_width=True):
             st.session_state.selected_category = "financial"
             st.rerun()
     
     with col2:
-        st.markdown("""
-            <div style="background: white; border: 2px solid #e9ecef; border-radius: 10px; 
-                        padding: 1.5rem; margin: 1rem 0; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); 
-                        transition: all 0.3s ease;">
-                <div style="display: flex; align-items: center; margin-bottom: 1rem;">
-                    <span style="font-size: 2rem; margin-right: 1rem;">🧮</span>
-                    <h3 style="font-size: 1.5rem; font-weight: 600; color: #004E89; margin: 0;">Calculation Tools</h3>
-                </div>
-                <p style="color: #6C757D; margin-bottom: 1rem; font-style: italic;">
-                    Advanced calculation and processing utilities
-                </p>
-                <div>
-                    <strong>4 Tools Available:</strong><br>
-                    • Delay Calculator<br>
-                    • Stamp Duty Calculator<br>
-                    • Deductions Table<br>
-                    • Excel EMD Processor
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(CARD_CALC_HTML, unsafe_allow_html=True)
         
         if st.button("Access Calculation Tools", key="btn_calculation", use_container_width=True):
             st.session_state.selected_category = "calculation"
             st.rerun()
     
     with col3:
-        st.markdown("""
-            <div style="background: white; border: 2px solid #e9ecef; border-radius: 10px; 
-                        padding: 1.5rem; margin: 1rem 0; box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1); 
-                        transition: all 0.3s ease;">
-                <div style="display: flex; align-items: center; margin-bottom: 1rem;">
-                    <span style="font-size: 2rem; margin-right: 1rem;">📊</span>
-                    <h3 style="font-size: 1.5rem; font-weight: 600; color: #004E89; margin: 0;">Report Tools</h3>
-                </div>
-                <p style="color: #6C757D; margin-bottom: 1rem; font-style: italic;">
-                    Comprehensive reporting and analysis solutions
-                </p>
-                <div>
-                    <strong>2 Tools Available:</strong><br>
-                    • Bill & Deviation Generator<br>
-                    • Financial Analysis
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(CARD_REPORT_HTML, unsafe_allow_html=True)
         
         if st.button("Access Report Tools", key="btn_reports", use_container_width=True):
             st.session_state.selected_category = "reports"
             st.rerun()
 
+@st.fragment
 def render_financial_tools():
     """Render financial tools section"""
     st.markdown("## 💰 Financial Tools")
@@ -185,22 +224,15 @@ def render_financial_tools():
     # Tool selection
     tool_option = st.selectbox(
         "Select a Financial Tool:",
-        ["Select Tool", "Bill Note Sheet", "EMD Refund", "Security Refund", "Financial Progress", "Hindi Bill Generator"]
+        ["Select Tool", *FINANCIAL_TOOLS]
     )
     
-    if tool_option == "Bill Note Sheet":
-        bill_note_sheet.main()
-    elif tool_option == "EMD Refund":
-        emd_refund.main()
-    elif tool_option == "Security Refund":
-        security_refund.main()
-    elif tool_option == "Financial Progress":
-        financial_progress.main()
-    elif tool_option == "Hindi Bill Generator":
-        hindi_bill_generator.main()
+    if tool_option in FINANCIAL_TOOLS:
+        run_tool(FINANCIAL_TOOLS[tool_option])
     elif tool_option == "Select Tool":
         st.info("Please select a financial tool from the dropdown above to begin.")
 
+@st.fragment
 def render_calculation_tools():
     """Render calculation tools section"""
     st.markdown("## 🧮 Calculation Tools")
@@ -209,20 +241,15 @@ def render_calculation_tools():
     # Tool selection
     tool_option = st.selectbox(
         "Select a Calculation Tool:",
-        ["Select Tool", "Delay Calculator", "Stamp Duty Calculator", "Deductions Table", "Excel EMD Processor"]
+        ["Select Tool", *CALCULATION_TOOLS]
     )
     
-    if tool_option == "Delay Calculator":
-        delay_calculator.main()
-    elif tool_option == "Stamp Duty Calculator":
-        stamp_duty_calculator.main()
-    elif tool_option == "Deductions Table":
-        deductions_table.main()
-    elif tool_option == "Excel EMD Processor":
-        excel_emd_processor.main()
+    if tool_option in CALCULATION_TOOLS:
+        run_tool(CALCULATION_TOOLS[tool_option])
     elif tool_option == "Select Tool":
         st.info("Please select a calculation tool from the dropdown above to begin.")
 
+@st.fragment
 def render_report_tools():
     """Render report tools section"""
     st.markdown("## 📊 Report Tools")
@@ -231,26 +258,17 @@ def render_report_tools():
     # Tool selection
     tool_option = st.selectbox(
         "Select a Report Tool:",
-        ["Select Tool", "Bill & Deviation Generator", "Financial Analysis"]
+        ["Select Tool", *REPORT_TOOLS]
     )
     
-    if tool_option == "Bill & Deviation Generator":
-        bill_deviation_generator.main()
-    elif tool_option == "Financial Analysis":
-        financial_analysis.main()
+    if tool_option in REPORT_TOOLS:
+        run_tool(REPORT_TOOLS[tool_option])
     elif tool_option == "Select Tool":
         st.info("Please select a report tool from the dropdown above to begin.")
 
 def render_footer():
     """Render application footer"""
-    st.markdown("""
-        <div style="background-color: #004E89; color: white; text-align: center; 
-                    padding: 2rem; margin-top: 3rem; border-radius: 10px;">
-            <h4 style="margin: 0 0 0.5rem 0; color: #FF6B35;">🏗️ PWD Tools - Infrastructure Management Suite</h4>
-            <p style="margin: 0; opacity: 0.9;">Prepared for Mrs. Premlata Jain, AAO, PWD Udaipur</p>
-            <p style="margin: 0; opacity: 0.9;">Enhanced with professional PWD-themed styling | Version 2.0.0</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 def main():
     """Main application function"""
@@ -267,7 +285,8 @@ def main():
     # Render sidebar
     render_sidebar()
     
-    # Render main content based on selected category
+    # Render main content based on selected category; the tool sections are
+    # fragments, so their own widgets rerun only that section
     if st.session_state.selected_category == "financial":
         render_financial_tools()
     elif st.session_state.selected_category == "calculation":
@@ -0,0 +1,139 @@
+"""
+Tests for the database utilities
+"""
+
+import os
+import tempfile
+import unittest
+
+from utils.database import DatabaseManager
+
+
+def _bill(number, contractor='ABC Construction', project='Road Construction Project'):
+    return {
+        'bill_number': number,
+        'bill_date': '2024-01-15',
+        'contractor_name': contractor,
+        'project_name': project,
+        'bill_amount': 1000.0,
+        'status': 'Active'
+    }
+
+
+class TransactionTest(unittest.TestCase):
+    """DatabaseManager.transaction commit and rollback"""
+
+    def setUp(self):
+        self.db = DatabaseManager(':memory:')
+        self.addCleanup(self.db.close)
+
+    def test_rollback_discards_all_writes(self):
+        with self.assertRaises(ValueError):
+            with self.db.transaction():
+                self.db.save_bill(_bill('B001/2024'))
+                self.db.save_emd_refund({'tender_number': 'T-1', 'contractor_name': 'XYZ'})
+                raise ValueError('abort')
+
+        self.assertEqual(len(self.db.get_bills()), 0)
+        self.assertEqual(len(self.db.get_emd_refunds()), 0)
+
+    def test_nested_writes_commit_together(self):
+        with self.db.transaction():
+            self.db.save_bill(_bill('B001/2024'))
+            self.db.save_bill(_bill('B002/2024'))
+
+        self.assertEqual(len(self.db.get_bills()), 2)
+
+
+class SearchRecordsTest(unittest.TestCase):
+    """Full-text and LIKE searches return the same rows"""
+
+    def setUp(self):
+        self.db = DatabaseManager(':memory:')
+        self.addCleanup(self.db.close)
+        self.db.save_bill(_bill('B001/2024', 'ABC Construction', 'Road Works'))
+        self.db.save_bill(_bill('B002/2024', 'Sharma & Sons', 'Drain "North" Section'))
+        self.db.save_bill(_bill('B003/2024', 'Construction Co', 'Bridge Repair'))
+
+    def _search_both(self, term, columns=None):
+        fts_available = self.db.fts_available
+        fts = self.db.search_records('bills', term, columns)
+        self.db.fts_available = False
+        try:
+            like = self.db.search_records('bills', term, columns)
+        finally:
+            self.db.fts_available = fts_available
+        return sorted(fts['bill_number']), sorted(like['bill_number'])
+
+    def test_fts_matches_like_fallback(self):
+        if not self.db.fts_available:
+            self.skipTest('SQLite built without FTS5 trigram support')
+
+        cases = [
+            ('construction', None),
+            ('struct', None),
+            ('B002', None),
+            ('"North"', None),
+            ('Sharma &', ['contractor_name']),
+            ('Road', ['contractor_name']),
+            ('missing', None),
+        ]
+        for term, columns in cases:
+            with self.subTest(term=term, columns=columns):
+                fts, like = self._search_both(term, columns)
+                self.assertEqual(fts, like)
+
+        self.assertEqual(self._search_both('construction')[0], ['B001/2024', 'B003/2024'])
+
+
+class ReadCacheTest(unittest.TestCase):
+    """Cached listings and statistics follow writes"""
+
+    def test_reads_see_writes(self):
+        db = DatabaseManager(':memory:')
+        self.addCleanup(db.close)
+
+        self.assertEqual(len(db.get_bills()), 0)
+        self.assertEqual(db.get_statistics()['total_bills'], 0)
+
+        bill_id = db.save_bill(_bill('B001/2024'))
+        self.assertEqual(list(db.get_bills()['bill_number']), ['B001/2024'])
+        self.assertEqual(db.get_statistics()['total_bills'], 1)
+
+        db.update_record('bills', bill_id, {'status': 'Paid'})
+        self.assertEqual(list(db.get_bills()['status']), ['Paid'])
+
+        db.delete_record('bills', bill_id)
+        self.assertEqual(len(db.get_bills()), 0)
+        self.assertEqual(db.get_statistics()['total_bills'], 0)
+
+    def test_in_memory_databases_do_not_share_cache(self):
+        first = DatabaseManager(':memory:')
+        second = DatabaseManager(':memory:')
+        self.addCleanup(first.close)
+        self.addCleanup(second.close)
+
+        first.save_bill(_bill('B001/2024'))
+
+        self.assertEqual(len(first.get_bills()), 1)
+        self.assertEqual(len(second.get_bills()), 0)
+        self.assertEqual(second.get_statistics()['total_bills'], 0)
+
+    def test_write_invalidates_other_manager_on_same_file(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'pwd.db')
+
+        writer = DatabaseManager(path)
+        self.addCleanup(writer.close)
+        # Same file under a different spelling of its path
+        reader = DatabaseManager(os.path.join(tmp.name, '.', 'pwd.db'), pool_size=1)
+        self.addCleanup(reader.close)
+
+        self.assertEqual(len(reader.get_bills()), 0)
+        writer.save_bill(_bill('B001/2024'))
+        self.assertEqual(len(reader.get_bills()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
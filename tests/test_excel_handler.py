@@ -0,0 +1,252 @@
+"""
+Tests for the Excel handling utilities
+"""
+
+import datetime
+import io
+import os
+import re
+import tempfile
+import unittest
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from utils import excel_handler
+from utils.excel_handler import ExcelHandler, create_excel_from_dict, get_excel_info
+
+if excel_handler.OPENPYXL_AVAILABLE:
+    from openpyxl import Workbook, load_workbook
+
+
+def _without_dimensions(wb):
+    """Save a workbook with the <dimension> element stripped from every sheet"""
+    saved = io.BytesIO()
+    wb.save(saved)
+    stripped = io.BytesIO()
+    with zipfile.ZipFile(saved) as src, zipfile.ZipFile(stripped, 'w') as dst:
+        for name in src.namelist():
+            data = src.read(name)
+            if name.startswith('xl/worksheets/'):
+                data = re.sub(rb'<dimension[^>]*/>', b'', data)
+            dst.writestr(name, data)
+    stripped.seek(0)
+    return stripped
+
+
+@unittest.skipUnless(excel_handler.OPENPYXL_AVAILABLE, "openpyxl is not installed")
+class GetExcelInfoTest(unittest.TestCase):
+    """get_excel_info sheet summaries"""
+
+    def test_written_workbook(self):
+        data = create_excel_from_dict({
+            'Bills': pd.DataFrame({'Bill No': ['B1', 'B2', 'B3'], 'Amount': [1.0, 2.0, 3.0]}),
+            'Blank': pd.DataFrame(),
+        })
+
+        info, error = get_excel_info(io.BytesIO(data))
+
+        self.assertIsNone(error)
+        self.assertEqual(info['file_size'], len(data))
+        self.assertEqual(info['sheet_names'], ['Bills', 'Blank'])
+        self.assertEqual(info['sheet_count'], 2)
+        self.assertEqual(
+            info['sheets_info']['Bills'],
+            {'rows': 3, 'columns': 2, 'column_names': ['Bill No', 'Amount']}
+        )
+        self.assertEqual(info['sheets_info']['Blank'], {'rows': 0, 'columns': 0, 'column_names': []})
+
+    def test_undimensioned_sheets(self):
+        wb = Workbook()
+        wb.active.title = 'Empty'
+        ws = wb.create_sheet('Data')
+        ws.append(['a', 'b'])
+        ws.append([1, 2])
+        ws.append([3, 4, 5])
+
+        info, error = get_excel_info(_without_dimensions(wb))
+
+        self.assertIsNone(error)
+        self.assertEqual(info['sheets_info']['Empty'], {'rows': 0, 'columns': 0, 'column_names': []})
+        self.assertEqual(
+            info['sheets_info']['Data'],
+            {'rows': 2, 'columns': 3, 'column_names': ['a', 'b', 'Unnamed: 2']}
+        )
+
+
+@unittest.skipUnless(excel_handler.OPENPYXL_AVAILABLE, "openpyxl is not installed")
+class CreateFormattedExcelTest(unittest.TestCase):
+    """create_formatted_excel output read back with openpyxl"""
+
+    def test_layout_values_and_formats(self):
+        df = pd.DataFrame({
+            'Work': ['Road', 'Drain'],
+            'Quantity': [12.5, 3.0],
+            'Amount': [150000.0, 250.5],
+            'Start': pd.to_datetime(['2024-01-15 10:30:00', '2024-02-01 00:00:00']),
+        })
+
+        wb = load_workbook(io.BytesIO(ExcelHandler.create_formatted_excel(df, title='Bill Report')))
+        ws = wb['Report']
+
+        self.assertEqual(ws['A1'].value, 'Bill Report')
+        self.assertEqual(ws['A1'].style, 'PWD Title')
+        self.assertTrue(ws['A2'].value.startswith('Generated on: '))
+        self.assertIn('A1:E1', ws.merged_cells)
+        # The merged title spans A:E, wider than the four data columns
+        header, *rows = ws.iter_rows(min_row=4, max_col=4)
+        self.assertEqual([cell.value for cell in header], ['Work', 'Quantity', 'Amount', 'Start'])
+        self.assertEqual({cell.style for cell in header}, {'PWD Header'})
+        self.assertEqual(
+            [[cell.value for cell in row] for row in rows],
+            [['Road', 12.5, 150000, datetime.datetime(2024, 1, 15, 10, 30)],
+             ['Drain', 3, 250.5, datetime.datetime(2024, 2, 1)]]
+        )
+        self.assertEqual(
+            [cell.number_format for cell in rows[0]],
+            ['General', '0.00', '#,##0.00', 'yyyy-mm-dd h:mm:ss']
+        )
+        self.assertEqual([cell.style for cell in rows[0]], ['PWD Data', 'PWD Number', 'PWD Amount', 'PWD Date'])
+
+    def test_writes_to_path(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'report.xlsx')
+
+        result = ExcelHandler.create_formatted_excel(pd.DataFrame({'Work': ['Road']}), path)
+
+        self.assertEqual(result, path)
+        self.assertEqual(load_workbook(path)['Report']['A5'].value, 'Road')
+
+    def test_object_date_columns_keep_date_formats(self):
+        df = pd.DataFrame({
+            'Work': ['Road', 'Drain'],
+            'Day': pd.Series([datetime.date(2024, 1, 15), None], dtype=object),
+            'Stamp': pd.Series([datetime.datetime(2024, 1, 15, 10, 30), datetime.datetime(2024, 2, 1)], dtype=object),
+        })
+
+        ws = load_workbook(io.BytesIO(ExcelHandler.create_formatted_excel(df))).active
+
+        day, stamp = ws['B5'], ws['C5']
+        self.assertTrue(day.is_date)
+        self.assertEqual(day.value, datetime.datetime(2024, 1, 15))
+        self.assertEqual(day.number_format, 'yyyy-mm-dd')
+        self.assertTrue(stamp.is_date)
+        self.assertEqual(stamp.value, datetime.datetime(2024, 1, 15, 10, 30))
+        self.assertEqual(stamp.number_format, 'yyyy-mm-dd h:mm:ss')
+        self.assertEqual(ws['A5'].number_format, 'General')
+
+
+@unittest.skipUnless(
+    excel_handler.OPENPYXL_AVAILABLE and excel_handler.XLSXWRITER_AVAILABLE,
+    "openpyxl and xlsxwriter are required"
+)
+class XlsxWriterOutputTest(unittest.TestCase):
+    """xlsxwriter-built workbooks read back with openpyxl"""
+
+    def test_write_excel_file(self):
+        df = pd.DataFrame({
+            'Name': ['A', None],
+            'Count': [1, 2],
+            'Rate': [1.5, np.nan],
+            'Paid': [True, False],
+            'Stamp': pd.to_datetime(['2024-01-15 10:30:00', None]),
+            'Day': pd.Series([datetime.date(2024, 3, 1), datetime.date(2024, 3, 2)], dtype=object),
+        })
+
+        wb = load_workbook(io.BytesIO(ExcelHandler.write_excel_file(df, sheet_name='Data')))
+        ws = wb['Data']
+
+        self.assertEqual(wb.sheetnames, ['Data'])
+        self.assertEqual([cell.value for cell in ws[1]], list(df.columns))
+        self.assertTrue(ws['A1'].font.b)
+        self.assertEqual(
+            [[cell.value for cell in row] for row in ws.iter_rows(min_row=2)],
+            [['A', 1, 1.5, True, datetime.datetime(2024, 1, 15, 10, 30), datetime.datetime(2024, 3, 1)],
+             [None, 2, None, False, None, datetime.datetime(2024, 3, 2)]]
+        )
+        self.assertEqual(ws['E2'].number_format, 'yyyy-mm-dd hh:mm:ss')
+        self.assertEqual(ws['F2'].number_format, 'yyyy-mm-dd')
+        self.assertEqual(ws['C2'].number_format, 'General')
+
+    def test_write_excel_file_sheets_to_path(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'sheets.xlsx')
+
+        result = ExcelHandler.write_excel_file({
+            'First': pd.DataFrame({'x': [1]}),
+            'Second': pd.DataFrame({'y': ['b']}),
+        }, path)
+
+        wb = load_workbook(path)
+        self.assertEqual(result, path)
+        self.assertEqual(wb.sheetnames, ['First', 'Second'])
+        self.assertEqual(wb['Second']['A2'].value, 'b')
+
+    def test_create_bill_excel_fast(self):
+        bill_data = {
+            'bill_number': 'B001/2024',
+            'bill_date': datetime.date(2024, 1, 15),
+            'contractor_name': 'ABC Construction',
+            'bill_amount': 500000,
+            'items': [
+                {'Description': 'Earthwork', 'Quantity': 10, 'Rate': 250.0},
+                {'Description': 'Concrete', 'Quantity': 4, 'Rate': 4500.0},
+            ],
+            'deductions': [
+                {'type': 'Income Tax', 'amount': 5000},
+            ],
+        }
+
+        wb = load_workbook(io.BytesIO(ExcelHandler.create_bill_excel_fast(bill_data)))
+
+        self.assertEqual(wb.sheetnames, ['Bill Summary', 'Bill Items', 'Deductions'])
+        ws = wb['Bill Summary']
+        self.assertEqual(ws['A1'].value, 'PWD BILL SUMMARY')
+        self.assertIn('A1:B1', ws.merged_cells)
+        self.assertEqual(
+            [[cell.value for cell in row] for row in ws.iter_rows(min_row=3, max_row=6)],
+            [['Bill Number:', 'B001/2024'],
+             ['Bill Date:', datetime.datetime(2024, 1, 15)],
+             ['Contractor Name:', 'ABC Construction'],
+             ['Project Name:', 'N/A']]
+        )
+        self.assertEqual(ws['B4'].number_format, 'yyyy-mm-dd')
+        self.assertEqual(ws['B9'].value, '₹500,000.00')
+        self.assertEqual(ws['B11'].value, '₹495,000.00')
+
+        ws = wb['Bill Items']
+        self.assertEqual(ws['A1'].value, 'BILL ITEMS')
+        self.assertEqual(
+            [[cell.value for cell in row] for row in ws.iter_rows(min_row=3, max_col=4)],
+            [['S.No.', 'Description', 'Quantity', 'Rate'],
+             [1, 'Earthwork', 10, 250],
+             [2, 'Concrete', 4, 4500]]
+        )
+        self.assertEqual(ws['B3'].fill.fgColor.rgb, 'FFFF6B35')
+
+        ws = wb['Deductions']
+        self.assertEqual([cell.value for cell in ws[4]][:3], [1, 'Income Tax', 5000])
+        self.assertEqual(ws['A3'].fill.fgColor.rgb, 'FF1A8A16')
+
+    def test_create_emd_template(self):
+        wb = load_workbook(io.BytesIO(ExcelHandler.create_emd_template()))
+
+        self.assertEqual(wb.sheetnames, ['EMD_Data', 'Instructions'])
+        ws = wb['EMD_Data']
+        self.assertEqual(ws.max_row, 3)
+        self.assertEqual(ws['A1'].value, 'Tender Number')
+        self.assertTrue(ws['A1'].font.b)
+        self.assertEqual([cell.value for cell in ws[2]][:4], ['T001/2024', 'ABC Construction', 50000, '2024-01-15'])
+        self.assertEqual(ws['G2'].value, '9876543210')
+
+        ws = wb['Instructions']
+        self.assertEqual(ws['A1'].value, 'EMD Processing Template Instructions')
+        self.assertIsNone(ws['A3'].value)
+        self.assertTrue(ws.cell(ws.max_row, 1).value.startswith('Template created: '))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Tests for the PDF generation utilities
+"""
+
+import os
+import tempfile
+import unittest
+
+from utils import pdf_generator
+
+
+@unittest.skipUnless(pdf_generator.REPORTLAB_AVAILABLE, "ReportLab is not installed")
+class BuildBillsParallelTest(unittest.TestCase):
+    """build_bills_parallel output naming"""
+
+    def test_slash_in_bill_number_stays_in_out_dir(self):
+        with tempfile.TemporaryDirectory() as out_dir:
+            paths = pdf_generator.build_bills_parallel(
+                [{'bill_number': 'B001/2024', 'bill_amount': 1000}], out_dir, workers=1
+            )
+
+            self.assertEqual(paths, [os.path.join(out_dir, '0001_B001_2024.pdf')])
+            self.assertEqual(os.listdir(out_dir), ['0001_B001_2024.pdf'])
+
+    def test_duplicate_and_missing_bill_numbers_get_separate_files(self):
+        bills = [
+            {'bill_number': 'B002/2024'},
+            {'bill_number': 'B002/2024'},
+            {'bill_number': None},
+            {'bill_number': ''},
+            {},
+        ]
+        with tempfile.TemporaryDirectory() as out_dir:
+            paths = pdf_generator.build_bills_parallel(bills, out_dir, workers=1)
+
+            self.assertEqual(
+                [os.path.basename(path) for path in paths],
+                ['0001_B002_2024.pdf', '0002_B002_2024.pdf', '0003_bill.pdf',
+                 '0004_bill.pdf', '0005_bill.pdf']
+            )
+            for path in paths:
+                with open(path, 'rb') as f:
+                    self.assertEqual(f.read(5), b'%PDF-')
+
+
+if __name__ == '__main__':
+    unittest.main()
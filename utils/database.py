@@ -4,29 +4,182 @@ Handle SQLite database operations for storing and retrieving data
 """
 
 import sqlite3
+import threading
+import queue
+import itertools
+from contextlib import contextmanager
+from functools import lru_cache
 import pandas as pd
+import streamlit as st
 from datetime import datetime
 import os
 import json
 
+# Default search columns for each table
+SEARCH_COLUMNS = {
+    'bills': ['bill_number', 'contractor_name', 'project_name'],
+    'emd_refunds': ['tender_number', 'contractor_name'],
+    'projects': ['project_name', 'project_code', 'contractor_name']
+}
+
+# Tables with a full-text index kept in sync by triggers
+FTS_TABLES = ['bills', 'emd_refunds', 'projects']
+
+# Tables that may be named by callers of the generic record helpers
+ALLOWED_TABLES = frozenset({'bills', 'emd_refunds', 'projects', 'deductions'})
+
+# Known numeric column dtypes; fixing them keeps chunked reads consistent
+# and spares pandas the type inference
+TABLE_DTYPES = {
+    'bills': {'id': 'Int64', 'bill_amount': 'float64'},
+    'emd_refunds': {'id': 'Int64', 'emd_amount': 'float64', 'interest_rate': 'float64', 'refund_amount': 'float64'},
+    'projects': {'id': 'Int64', 'agreement_amount': 'float64'},
+    'deductions': {'id': 'Int64', 'bill_id': 'Int64', 'amount': 'float64', 'rate': 'float64', 'is_statutory': 'Int64'}
+}
+
+# Columns returned by the listing queries
+TABLE_COLUMNS = {
+    'bills': ['id', 'bill_number', 'bill_date', 'contractor_name', 'project_name',
+              'bill_amount', 'status', 'created_at'],
+    'emd_refunds': ['id', 'tender_number', 'contractor_name', 'emd_amount', 'deposit_date',
+                    'refund_date', 'interest_rate', 'refund_amount', 'status', 'created_at'],
+    'projects': ['id', 'project_name', 'project_code', 'contractor_name', 'agreement_amount',
+                 'start_date', 'completion_date', 'status', 'created_at']
+}
+
+# Timestamps written by SQLite itself (CURRENT_TIMESTAMP) and safe to parse;
+# user-entered date columns are returned as stored
+TIMESTAMP_COLUMNS = {
+    'bills': ['created_at'],
+    'emd_refunds': ['created_at'],
+    'projects': ['created_at']
+}
+
+# LIMIT -1 means no limit; one fixed statement text per table keeps it in
+# SQLite's statement cache
+LISTING_QUERIES = {
+    table: f"SELECT {', '.join(columns)} FROM {table} ORDER BY created_at DESC LIMIT ?"
+    for table, columns in TABLE_COLUMNS.items()
+}
+
+# Columns update_record may set
+UPDATABLE_COLUMNS = {
+    'bills': frozenset({'bill_number', 'bill_date', 'contractor_name', 'project_name',
+                        'bill_amount', 'status'}),
+    'emd_refunds': frozenset({'tender_number', 'contractor_name', 'emd_amount', 'deposit_date',
+                              'refund_date', 'interest_rate', 'refund_amount', 'status'}),
+    'projects': frozenset({'project_name', 'project_code', 'contractor_name', 'agreement_amount',
+                           'start_date', 'completion_date', 'status'}),
+    'deductions': frozenset({'bill_id', 'deduction_type', 'amount', 'rate', 'is_statutory'})
+}
+
+EXPORT_CHUNK_SIZE = 10_000
+
+# CSV export pins only the integer columns; amounts keep whatever type SQLite
+# returns so whole numbers stored as integers are still written as 500000
+EXPORT_DTYPES = {
+    table: {column: dtype for column, dtype in dtypes.items() if dtype == 'Int64'}
+    for table, dtypes in TABLE_DTYPES.items()
+}
+
+def _check_table(table):
+    """Reject table names outside the whitelist before SQL interpolation"""
+    if table not in ALLOWED_TABLES:
+        raise ValueError(f"Unknown table: {table}")
+
+@lru_cache(maxsize=128)
+def _compile_update(table, columns):
+    """Build the UPDATE statement for a table and sorted column tuple"""
+    _check_table(table)
+    unknown = [col for col in columns if col not in UPDATABLE_COLUMNS[table]]
+    if unknown:
+        raise ValueError(f"Cannot update columns on {table}: {', '.join(unknown)}")
+    
+    set_clause = ", ".join(f"{col} = ?" for col in columns)
+    return f"UPDATE {table} SET {set_clause} WHERE id = ?"
+
+class ConnectionPool:
+    """Fixed-size pool of read-only SQLite connections"""
+    
+    def __init__(self, db_path, size=4):
+        """Open size connections to db_path"""
+        self._queue = queue.Queue()
+        for _ in range(size):
+            conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-20000")
+            self._queue.put(conn)
+    
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection, blocking until one is free"""
+        conn = self._queue.get()
+        try:
+            yield conn
+        finally:
+            self._queue.put(conn)
+    
+    def close(self):
+        """Close all idle connections"""
+        while True:
+            try:
+                self._queue.get_nowait().close()
+            except queue.Empty:
+                break
+
 class DatabaseManager:
     """Database manager for PWD Tools application"""
     
-    def __init__(self, db_path="pwd_tools.db"):
+    def __init__(self, db_path="pwd_tools.db", pool_size=4):
         """Initialize database manager"""
         self.db_path = db_path
+        # Cached reads are keyed per database: file paths are resolved so
+        # equivalent relative paths agree, and every in-memory database is
+        # private to its manager
+        if db_path == ":memory:":
+            self._cache_key = f":memory:{next(_memory_db_ids)}"
+        else:
+            self._cache_key = os.path.abspath(db_path)
+        # Writes go through one long-lived connection shared across Streamlit
+        # reruns; the lock serializes them since sessions run on separate threads
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
         self.init_database()
+        
+        # Reads use pooled connections so they run in parallel under WAL.
+        # Each in-memory connection is a separate database, so those share
+        # the writer instead.
+        if db_path == ":memory:":
+            self._pool = None
+        else:
+            self._pool = ConnectionPool(db_path, size=pool_size)
+    
+    def _cache_args(self):
+        """Hashed arguments identifying this database's current cache entries"""
+        return self._cache_key, _cache_generations.get(self._cache_key, 0)
+    
+    @contextmanager
+    def _reader(self):
+        """Yield a connection for read-only queries"""
+        if self._pool is None:
+            with self._lock:
+                yield self.conn
+        else:
+            with self._pool.acquire() as conn:
+                yield conn
     
     def init_database(self):
         """Initialize database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self.conn.cursor()
             
             # Bills table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS bills (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    bill_number TEXT NOT NULL,
+                    bill_number TEXT NOT NULL UNIQUE,
                     bill_date DATE,
                     contractor_name TEXT,
                     project_name TEXT,
@@ -40,7 +193,7 @@ class DatabaseManager:
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS emd_refunds (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    tender_number TEXT NOT NULL,
+                    tender_number TEXT NOT NULL UNIQUE,
                     contractor_name TEXT,
                     emd_amount REAL,
                     deposit_date DATE,
@@ -90,11 +243,88 @@ class DatabaseManager:
                 )
             """)
             
-            conn.commit()
+            # Connection tuning: WAL lets readers proceed during writes and
+            # NORMAL sync is safe under WAL while avoiding an fsync per insert
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA cache_size=-20000")
+            cursor.execute("PRAGMA foreign_keys=ON")
+            
+            # Indexes for the created_at listings and deduction lookups
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_bills_created ON bills(created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_emd_refunds_created ON emd_refunds(created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_projects_created ON projects(created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_deductions_bill ON deductions(bill_id)")
+            
+            # Full-text search indexes (trigram keeps LIKE '%term%' semantics)
+            try:
+                for table in FTS_TABLES:
+                    self._init_fts(cursor, table)
+                self.fts_available = True
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5 or older than 3.34
+                self.fts_available = False
+    
+    def _init_fts(self, cursor, table):
+        """Create external-content FTS5 table and sync triggers for a table"""
+        columns = SEARCH_COLUMNS[table]
+        column_list = ", ".join(columns)
+        new_values = ", ".join(f"new.{col}" for col in columns)
+        old_values = ", ".join(f"old.{col}" for col in columns)
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (f"{table}_fts",))
+        exists = cursor.fetchone() is not None
+        
+        cursor.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5(
+                {column_list}, content='{table}', content_rowid='id', tokenize='trigram'
+            )
+        """)
+        
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {table}_fts (rowid, {column_list}) VALUES (new.id, {new_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {table}_fts ({table}_fts, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE ON {table} BEGIN
+                INSERT INTO {table}_fts ({table}_fts, rowid, {column_list}) VALUES ('delete', old.id, {old_values});
+                INSERT INTO {table}_fts (rowid, {column_list}) VALUES (new.id, {new_values});
+            END
+        """)
+        
+        # Index rows that existed before the FTS table was created
+        if not exists:
+            cursor.execute(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')")
+    
+    @contextmanager
+    def transaction(self):
+        """Run writes in one BEGIN IMMEDIATE transaction; nested calls join it"""
+        with self._lock:
+            if self.conn.in_transaction:
+                yield self.conn
+                return
+            
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+        
+        _clear_read_caches(self._cache_key)
     
     def save_bill(self, bill_data):
         """Save bill information to database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -114,24 +344,26 @@ class DatabaseManager:
             
             # Save deductions if any
             if 'deductions' in bill_data:
-                for deduction in bill_data['deductions']:
-                    cursor.execute("""
-                        INSERT INTO deductions (bill_id, deduction_type, amount, rate, is_statutory)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
+                rows = [
+                    (
                         bill_id,
                         deduction['type'],
                         deduction['amount'],
                         deduction.get('rate', 0),
                         deduction.get('statutory', False)
-                    ))
-            
-            conn.commit()
-            return bill_id
+                    )
+                    for deduction in bill_data['deductions']
+                ]
+                cursor.executemany("""
+                    INSERT INTO deductions (bill_id, deduction_type, amount, rate, is_statutory)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+        
+        return bill_id
     
     def save_emd_refund(self, emd_data):
         """Save EMD refund information to database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -149,13 +381,12 @@ class DatabaseManager:
                 emd_data.get('refund_amount'),
                 emd_data.get('status', 'Processed')
             ))
-            
-            conn.commit()
-            return cursor.lastrowid
+        
+        return cursor.lastrowid
     
     def save_project(self, project_data):
         """Save project information to database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -171,143 +402,166 @@ class DatabaseManager:
                 project_data.get('completion_date'),
                 project_data.get('status', 'Active')
             ))
-            
-            conn.commit()
-            return cursor.lastrowid
+        
+        return cursor.lastrowid
     
     def get_bills(self, limit=None):
         """Retrieve bills from database"""
-        with sqlite3.connect(self.db_path) as conn:
-            query = "SELECT * FROM bills ORDER BY created_at DESC"
-            if limit:
-                query += f" LIMIT {limit}"
-            
-            df = pd.read_sql_query(query, conn)
-            return df
+        return _cached_bills(self, *self._cache_args(), limit)
+    
+    def _read_bills(self, limit=None):
+        """Query bills table, bypassing the Streamlit data cache"""
+        return self._read_listing('bills', limit)
     
     def get_emd_refunds(self, limit=None):
         """Retrieve EMD refunds from database"""
-        with sqlite3.connect(self.db_path) as conn:
-            query = "SELECT * FROM emd_refunds ORDER BY created_at DESC"
-            if limit:
-                query += f" LIMIT {limit}"
-            
-            df = pd.read_sql_query(query, conn)
-            return df
+        return _cached_emd_refunds(self, *self._cache_args(), limit)
+    
+    def _read_emd_refunds(self, limit=None):
+        """Query emd_refunds table, bypassing the Streamlit data cache"""
+        return self._read_listing('emd_refunds', limit)
     
     def get_projects(self, limit=None):
         """Retrieve projects from database"""
-        with sqlite3.connect(self.db_path) as conn:
-            query = "SELECT * FROM projects ORDER BY created_at DESC"
-            if limit:
-                query += f" LIMIT {limit}"
-            
-            df = pd.read_sql_query(query, conn)
-            return df
+        return _cached_projects(self, *self._cache_args(), limit)
     
-    def get_bill_with_deductions(self, bill_id):
-        """Get bill with associated deductions"""
-        with sqlite3.connect(self.db_path) as conn:
-            # Get bill
-            bill_query = "SELECT * FROM bills WHERE id = ?"
-            bill_df = pd.read_sql_query(bill_query, conn, params=(bill_id,))
-            
-            # Get deductions
+    def _read_projects(self, limit=None):
+        """Query projects table, bypassing the Streamlit data cache"""
+        return self._read_listing('projects', limit)
+    
+    def _read_listing(self, table, limit):
+        """Run the listing query for a table with known column types"""
+        with self._reader() as conn:
+            return pd.read_sql_query(
+                LISTING_QUERIES[table], conn,
+                params=(limit if limit else -1,),
+                parse_dates=TIMESTAMP_COLUMNS[table],
+                dtype=TABLE_DTYPES[table]
+            )
+    
+    def _fetch_dicts(self, query, params=()):
+        """Run a query and return rows as dicts; cheaper than a DataFrame for small results"""
+        with self._reader() as conn:
+            cursor = conn.execute(query, params)
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+    
+    def get_bill_with_deductions(self, bill_id, summarize=False):
+        """Get bill with associated deductions as lists of row dicts
+        
+        With summarize=True the deductions are totalled per deduction type,
+        which is the shape report views need.
+        """
+        bill_query = "SELECT * FROM bills WHERE id = ?"
+        
+        if summarize:
+            deduction_query = """
+                SELECT deduction_type, SUM(amount) AS amount FROM deductions
+                WHERE bill_id = ? GROUP BY deduction_type ORDER BY deduction_type
+            """
+        else:
             deduction_query = "SELECT * FROM deductions WHERE bill_id = ?"
-            deduction_df = pd.read_sql_query(deduction_query, conn, params=(bill_id,))
-            
-            return bill_df, deduction_df
+        
+        return (
+            self._fetch_dicts(bill_query, (bill_id,)),
+            self._fetch_dicts(deduction_query, (bill_id,))
+        )
     
     def search_records(self, table, search_term, columns=None):
         """Search records in specified table"""
+        _check_table(table)
+        
+        indexed_columns = SEARCH_COLUMNS.get(table, [])
         if not columns:
-            # Default search columns for each table
-            search_columns = {
-                'bills': ['bill_number', 'contractor_name', 'project_name'],
-                'emd_refunds': ['tender_number', 'contractor_name'],
-                'projects': ['project_name', 'project_code', 'contractor_name']
-            }
-            columns = search_columns.get(table, [])
+            columns = indexed_columns
         
         if not columns:
             return pd.DataFrame()
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Build search query
-            conditions = []
-            params = []
-            
-            for column in columns:
-                conditions.append(f"{column} LIKE ?")
-                params.append(f"%{search_term}%")
-            
-            where_clause = " OR ".join(conditions)
-            query = f"SELECT * FROM {table} WHERE {where_clause} ORDER BY created_at DESC"
-            
-            df = pd.read_sql_query(query, conn, params=params)
+        use_fts = (
+            self.fts_available
+            and table in FTS_TABLES
+            and set(columns) <= set(indexed_columns)
+            # Trigram index only matches terms of three or more characters
+            and len(search_term) >= 3
+        )
+        
+        with self._reader() as conn:
+            if use_fts:
+                # Quoted phrase matches the term as a substring of any listed column
+                phrase = '"' + search_term.replace('"', '""') + '"'
+                match = f"{{{' '.join(columns)}}} : {phrase}"
+                query = f"""
+                    SELECT t.* FROM {table} t
+                    JOIN {table}_fts f ON f.rowid = t.id
+                    WHERE {table}_fts MATCH ?
+                    ORDER BY t.created_at DESC
+                """
+                return pd.read_sql_query(query, conn, params=(match,))
+            
+            # Single LIKE over the joined columns; the unit separator keeps a
+            # term from matching across a column boundary
+            search_blob = " || char(31) || ".join(f"coalesce({column}, '')" for column in columns)
+            query = f"SELECT * FROM {table} WHERE ({search_blob}) LIKE ? ORDER BY created_at DESC"
+            
+            df = pd.read_sql_query(query, conn, params=(f"%{search_term}%",))
             return df
     
     def update_record(self, table, record_id, updates):
         """Update record in specified table"""
-        with sqlite3.connect(self.db_path) as conn:
+        # Sorted columns give one cached statement per column set
+        columns = tuple(sorted(updates))
+        query = _compile_update(table, columns)
+        params = [updates[col] for col in columns]
+        params.append(record_id)
+        
+        with self.transaction() as conn:
             cursor = conn.cursor()
-            
-            # Build update query
-            set_clauses = []
-            params = []
-            
-            for column, value in updates.items():
-                set_clauses.append(f"{column} = ?")
-                params.append(value)
-            
-            params.append(record_id)
-            
-            set_clause = ", ".join(set_clauses)
-            query = f"UPDATE {table} SET {set_clause} WHERE id = ?"
-            
             cursor.execute(query, params)
-            conn.commit()
-            
-            return cursor.rowcount > 0
+        
+        return cursor.rowcount > 0
     
     def delete_record(self, table, record_id):
         """Delete record from specified table"""
-        with sqlite3.connect(self.db_path) as conn:
+        _check_table(table)
+        
+        with self.transaction() as conn:
             cursor = conn.cursor()
             
-            cursor.execute(f"DELETE FROM {table} WHERE id = ?", (record_id,))
-            conn.commit()
+            # Deductions reference bills, so remove them first with foreign keys on
+            if table == 'bills':
+                cursor.execute("DELETE FROM deductions WHERE bill_id = ?", (record_id,))
             
-            return cursor.rowcount > 0
+            cursor.execute(f"DELETE FROM {table} WHERE id = ?", (record_id,))
+        
+        return cursor.rowcount > 0
     
     def get_statistics(self):
         """Get database statistics"""
-        stats = {}
+        return _cached_statistics(self, *self._cache_args())
+    
+    def _read_statistics(self):
+        """Compute database statistics, bypassing the Streamlit data cache"""
+        # Single statement so all figures come from one SQLite execution
+        query = """
+            SELECT
+                (SELECT COUNT(*) FROM bills),
+                (SELECT COUNT(*) FROM emd_refunds),
+                (SELECT COUNT(*) FROM projects),
+                (SELECT COUNT(*) FROM deductions),
+                (SELECT COALESCE(SUM(bill_amount), 0) FROM bills WHERE status = 'Active'),
+                (SELECT COALESCE(SUM(emd_amount), 0) FROM emd_refunds),
+                (SELECT COALESCE(SUM(agreement_amount), 0) FROM projects WHERE status = 'Active')
+        """
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Count records in each table
-            tables = ['bills', 'emd_refunds', 'projects', 'deductions']
-            
-            for table in tables:
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                stats[f"total_{table}"] = cursor.fetchone()[0]
-            
-            # Additional statistics
-            cursor.execute("SELECT SUM(bill_amount) FROM bills WHERE status = 'Active'")
-            result = cursor.fetchone()[0]
-            stats['total_active_bills_amount'] = result if result else 0
-            
-            cursor.execute("SELECT SUM(emd_amount) FROM emd_refunds")
-            result = cursor.fetchone()[0]
-            stats['total_emd_amount'] = result if result else 0
-            
-            cursor.execute("SELECT SUM(agreement_amount) FROM projects WHERE status = 'Active'")
-            result = cursor.fetchone()[0]
-            stats['total_active_projects_value'] = result if result else 0
+        with self._reader() as conn:
+            row = conn.execute(query).fetchone()
         
-        return stats
+        keys = [
+            'total_bills', 'total_emd_refunds', 'total_projects', 'total_deductions',
+            'total_active_bills_amount', 'total_emd_amount', 'total_active_projects_value'
+        ]
+        return dict(zip(keys, row))
     
     def backup_database(self, backup_path=None):
         """Create database backup"""
@@ -316,81 +570,138 @@ class DatabaseManager:
             backup_path = f"pwd_tools_backup_{timestamp}.db"
         
         try:
-            # Simple file copy for SQLite
-            import shutil
-            shutil.copy2(self.db_path, backup_path)
+            # Online backup API copies a consistent snapshot, including WAL pages
+            dst = sqlite3.connect(backup_path)
+            try:
+                with self._reader() as conn:
+                    conn.backup(dst, pages=1000)
+            finally:
+                dst.close()
             return backup_path
         except Exception as e:
             raise Exception(f"Backup failed: {str(e)}")
     
     def export_to_csv(self, table, file_path=None):
         """Export table data to CSV"""
+        _check_table(table)
+        
         if not file_path:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             file_path = f"{table}_export_{timestamp}.csv"
         
-        with sqlite3.connect(self.db_path) as conn:
-            df = pd.read_sql_query(f"SELECT * FROM {table}", conn)
-            df.to_csv(file_path, index=False)
-            
+        # Stream in chunks so memory stays flat regardless of table size
+        with self._reader() as conn, open(file_path, 'w', newline='', encoding='utf-8') as f:
+            chunks = pd.read_sql_query(
+                f"SELECT * FROM {table}", conn,
+                chunksize=EXPORT_CHUNK_SIZE, dtype=EXPORT_DTYPES[table]
+            )
+            header = True
+            for chunk in chunks:
+                chunk.to_csv(f, index=False, header=header)
+                header = False
+        
         return file_path
     
     def close(self):
         """Close database connection (for cleanup)"""
-        # SQLite connections are closed automatically when using context manager
-        pass
+        if self._pool is not None:
+            self._pool.close()
+        with self._lock:
+            self.conn.close()
+
+# Numbering for in-memory databases, which have no path to key caches by
+_memory_db_ids = itertools.count(1)
+
+# Write generation per database cache key; bumping it retires that
+# database's cached reads without touching other databases' entries
+_cache_generations = {}
+_generation_counter = itertools.count(1)
+
+# Cached read helpers; the manager argument is excluded from hashing so
+# entries are keyed by database, write generation and arguments only
+@st.cache_data(ttl=60)
+def _cached_bills(_db, cache_key, generation, limit):
+    return _db._read_bills(limit)
+
+@st.cache_data(ttl=60)
+def _cached_emd_refunds(_db, cache_key, generation, limit):
+    return _db._read_emd_refunds(limit)
+
+@st.cache_data(ttl=60)
+def _cached_projects(_db, cache_key, generation, limit):
+    return _db._read_projects(limit)
+
+@st.cache_data(ttl=60)
+def _cached_statistics(_db, cache_key, generation):
+    return _db._read_statistics()
+
+def _clear_read_caches(cache_key):
+    """Invalidate one database's cached reads after a write"""
+    # Outdated entries are never requested again and age out with the TTL
+    _cache_generations[cache_key] = next(_generation_counter)
 
 # Example usage functions
-def get_db_manager():
-    """Get database manager instance"""
-    return DatabaseManager()
+@st.cache_resource
+def get_db_manager(db_path="pwd_tools.db"):
+    """Get database manager instance shared across Streamlit reruns"""
+    return DatabaseManager(db_path)
 
 def init_sample_data():
     """Initialize database with sample data for testing"""
-    db = DatabaseManager()
-    
-    # Sample bill
-    sample_bill = {
-        'bill_number': 'B001/2024',
-        'bill_date': '2024-01-15',
-        'contractor_name': 'ABC Construction',
-        'project_name': 'Road Construction Project',
-        'bill_amount': 500000,
-        'status': 'Active',
-        'deductions': [
-            {'type': 'Income Tax', 'amount': 5000, 'rate': 1.0, 'statutory': True},
-            {'type': 'Security Deposit', 'amount': 25000, 'rate': 5.0, 'statutory': False}
-        ]
-    }
-    
-    bill_id = db.save_bill(sample_bill)
-    
-    # Sample EMD refund
-    sample_emd = {
-        'tender_number': 'T001/2024',
-        'contractor_name': 'XYZ Builders',
-        'emd_amount': 50000,
-        'deposit_date': '2024-01-10',
-        'refund_date': '2024-02-10',
-        'interest_rate': 6.0,
-        'refund_amount': 50500,
-        'status': 'Processed'
-    }
+    db = get_db_manager()
     
-    emd_id = db.save_emd_refund(sample_emd)
-    
-    # Sample project
-    sample_project = {
-        'project_name': 'Bridge Construction',
-        'project_code': 'PWD/BRG/001',
-        'contractor_name': 'PQR Infrastructure',
-        'agreement_amount': 2000000,
-        'start_date': '2024-01-01',
-        'completion_date': '2024-12-31',
-        'status': 'Active'
-    }
+    # Only seed an empty database so repeated calls don't duplicate rows
+    if db._fetch_dicts("SELECT 1 FROM bills LIMIT 1"):
+        return {
+            'bill_id': None,
+            'emd_id': None,
+            'project_id': None
+        }
     
-    project_id = db.save_project(sample_project)
+    # One transaction for all three inserts instead of a commit per save
+    with db.transaction():
+        # Sample bill
+        sample_bill = {
+            'bill_number': 'B001/2024',
+            'bill_date': '2024-01-15',
+            'contractor_name': 'ABC Construction',
+            'project_name': 'Road Construction Project',
+            'bill_amount': 500000,
+            'status': 'Active',
+            'deductions': [
+                {'type': 'Income Tax', 'amount': 5000, 'rate': 1.0, 'statutory': True},
+                {'type': 'Security Deposit', 'amount': 25000, 'rate': 5.0, 'statutory': False}
+            ]
+        }
+        
+        bill_id = db.save_bill(sample_bill)
+        
+        # Sample EMD refund
+        sample_emd = {
+            'tender_number': 'T001/2024',
+            'contractor_name': 'XYZ Builders',
+            'emd_amount': 50000,
+            'deposit_date': '2024-01-10',
+            'refund_date': '2024-02-10',
+            'interest_rate': 6.0,
+            'refund_amount': 50500,
+            'status': 'Processed'
+        }
+        
+        emd_id = db.save_emd_refund(sample_emd)
+        
+        # Sample project
+        sample_project = {
+            'project_name': 'Bridge Construction',
+            'project_code': 'PWD/BRG/001',
+            'contractor_name': 'PQR Infrastructure',
+            'agreement_amount': 2000000,
+            'start_date': '2024-01-01',
+            'completion_date': '2024-12-31',
+            'status': 'Active'
+        }
+        
+        project_id = db.save_project(sample_project)
     
     return {
         'bill_id': bill_id,
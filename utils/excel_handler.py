@@ -4,18 +4,71 @@ Read, write, and process Excel files for various PWD operations
 """
 
 import pandas as pd
+import numpy as np
 import io
-from datetime import datetime
+import re
+from datetime import datetime, date
 import os
 
 try:
     from openpyxl import Workbook, load_workbook
-    from openpyxl.styles import Font, Fill, PatternFill, Border, Side, Alignment
-    from openpyxl.utils.dataframe import dataframe_to_rows
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Fill, PatternFill, Border, Side, Alignment, NamedStyle
+    from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+if OPENPYXL_AVAILABLE:
+    # Style objects are immutable, so they are built once per process and
+    # registered as named styles on every new workbook. Colours are full
+    # ARGB values so the alpha channel is explicitly opaque.
+    _TITLE_FONT_16 = Font(name='Arial', size=16, bold=True, color='FF004E89')
+    _TITLE_FONT_14 = Font(name='Arial', size=14, bold=True, color='FF004E89')
+    _SUBTITLE_FONT = Font(name='Arial', size=10, italic=True)
+    _SUBHEADER_FONT = Font(name='Arial', size=12, bold=True, color='FFFFFFFF')
+    _SUBHEADER_FILL = PatternFill(start_color='FFFF6B35', end_color='FFFF6B35', fill_type='solid')
+    _SECTION_HEADER_FONT = Font(name='Arial', size=11, bold=True, color='FFFFFFFF')
+    _DEDUCTIONS_HEADER_FILL = PatternFill(start_color='FF1A8A16', end_color='FF1A8A16', fill_type='solid')
+    _NORMAL_FONT = Font(name='Arial', size=10)
+    _LABEL_FONT = Font(name='Arial', size=11, bold=True)
+    _VALUE_FONT = Font(name='Arial', size=11)
+    _BORDER_THIN = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    _CENTER_ALIGN = Alignment(horizontal='center')
+    
+    _NAMED_STYLES = (
+        ('PWD Title', {'font': _TITLE_FONT_16, 'alignment': _CENTER_ALIGN}),
+        ('PWD Subtitle', {'font': _SUBTITLE_FONT}),
+        ('PWD Header', {'font': _SUBHEADER_FONT, 'fill': _SUBHEADER_FILL, 'border': _BORDER_THIN, 'alignment': _CENTER_ALIGN}),
+        ('PWD Data', {'font': _NORMAL_FONT, 'border': _BORDER_THIN}),
+        ('PWD Date', {'font': _NORMAL_FONT, 'border': _BORDER_THIN, 'number_format': 'yyyy-mm-dd h:mm:ss'}),
+        ('PWD Date Only', {'font': _NORMAL_FONT, 'border': _BORDER_THIN, 'number_format': 'yyyy-mm-dd'}),
+        ('PWD Number', {'font': _NORMAL_FONT, 'border': _BORDER_THIN, 'number_format': '0.00'}),
+        ('PWD Amount', {'font': _NORMAL_FONT, 'border': _BORDER_THIN, 'number_format': '#,##0.00'}),
+        ('PWD Section Title', {'font': _TITLE_FONT_14, 'alignment': _CENTER_ALIGN}),
+        ('PWD Items Header', {'font': _SECTION_HEADER_FONT, 'fill': _SUBHEADER_FILL, 'alignment': _CENTER_ALIGN}),
+        ('PWD Deductions Header', {'font': _SECTION_HEADER_FONT, 'fill': _DEDUCTIONS_HEADER_FILL, 'alignment': _CENTER_ALIGN}),
+        ('PWD Label', {'font': _LABEL_FONT}),
+        ('PWD Value', {'font': _VALUE_FONT}),
+    )
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Header cell format of unformatted sheets, matching pandas' to_excel header
+_PLAIN_HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+# Currency symbols and thousands separators stripped from amount columns
+_CURRENCY_RE = re.compile('[₹,$]')
+
 class ExcelHandler:
     """Excel file handling utility class"""
     
@@ -24,15 +77,16 @@ class ExcelHandler:
         pass
     
     @staticmethod
-    def read_excel_file(file_path_or_buffer, sheet_name=0):
+    def read_excel_file(file_path_or_buffer, sheet_name=0, usecols=None, parse_dates=None, dtype=None):
         """Read Excel file and return DataFrame"""
         try:
-            if isinstance(file_path_or_buffer, str):
-                # File path
-                df = pd.read_excel(file_path_or_buffer, sheet_name=sheet_name)
-            else:
-                # File buffer (from Streamlit file uploader)
-                df = pd.read_excel(file_path_or_buffer, sheet_name=sheet_name)
+            # File path or file buffer (from Streamlit file uploader); pandas
+            # picks the engine from the content and already opens .xlsx
+            # workbooks read-only
+            df = pd.read_excel(
+                file_path_or_buffer, sheet_name=sheet_name, usecols=usecols,
+                parse_dates=parse_dates, dtype=dtype
+            )
             
             return df
         except Exception as e:
@@ -41,141 +95,172 @@ class ExcelHandler:
     @staticmethod
     def write_excel_file(data, file_path=None, sheet_name='Sheet1'):
         """Write DataFrame to Excel file"""
+        sheets = data if isinstance(data, dict) else {sheet_name: data}
+        
         if file_path is None:
             # Return as buffer
             buffer = io.BytesIO()
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                if isinstance(data, dict):
-                    for sheet, df in data.items():
-                        df.to_excel(writer, sheet_name=sheet, index=False)
-                else:
-                    data.to_excel(writer, sheet_name=sheet_name, index=False)
+            ExcelHandler._write_sheets(buffer, sheets)
             
-            buffer.seek(0)
             return buffer.getvalue()
         else:
-            # Write to file
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                if isinstance(data, dict):
-                    for sheet, df in data.items():
-                        df.to_excel(writer, sheet_name=sheet, index=False)
-                else:
-                    data.to_excel(writer, sheet_name=sheet_name, index=False)
+            # Write to file path or writable binary file object
+            ExcelHandler._write_sheets(file_path, sheets)
             
             return file_path
     
+    @staticmethod
+    def _write_sheets(target, sheets):
+        """Write unformatted DataFrames, one sheet each"""
+        if not XLSXWRITER_AVAILABLE:
+            with pd.ExcelWriter(target) as writer:
+                for sheet, df in sheets.items():
+                    df.to_excel(writer, sheet_name=sheet, index=False)
+            return
+        
+        # constant_memory flushes each row once the next one starts, so rows
+        # are written strictly in order here (DataFrame.to_excel writes
+        # column by column and would lose data in this mode)
+        workbook = xlsxwriter.Workbook(target, {'constant_memory': True, 'strings_to_numbers': False, 'nan_inf_to_errors': True})
+        header_format = workbook.add_format(_PLAIN_HEADER_FORMAT)
+        datetime_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+        date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+        
+        for sheet, df in sheets.items():
+            worksheet = workbook.add_worksheet(sheet)
+            worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+            
+            for row_idx, row in enumerate(df.to_numpy(dtype=object).tolist(), 1):
+                for col_idx, value in enumerate(row):
+                    ExcelHandler._write_cell(worksheet, row_idx, col_idx, value, datetime_format, date_format)
+        
+        workbook.close()
+    
+    @staticmethod
+    def _write_cell(worksheet, row_idx, col_idx, value, datetime_format, date_format, cell_format=None):
+        """Write one DataFrame value to an xlsxwriter worksheet"""
+        if pd.api.types.is_scalar(value) and pd.isna(value):
+            if cell_format is not None:
+                worksheet.write_blank(row_idx, col_idx, None, cell_format)
+        elif isinstance(value, datetime):
+            worksheet.write_datetime(row_idx, col_idx, value, datetime_format)
+        elif isinstance(value, date):
+            worksheet.write_datetime(row_idx, col_idx, value, date_format)
+        elif isinstance(value, (str, bool, int, float)):
+            worksheet.write(row_idx, col_idx, value, cell_format)
+        else:
+            worksheet.write_string(row_idx, col_idx, str(value), cell_format)
+    
+    @staticmethod
+    def _save_workbook(wb, file_path=None):
+        """Save workbook to a path or binary file object, or return its bytes"""
+        if file_path is not None:
+            # Paths and writable file objects are written to directly
+            wb.save(file_path)
+            return file_path
+        
+        # getvalue() hands back the buffer contents without a further copy
+        buffer = io.BytesIO()
+        wb.save(buffer)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _add_named_styles(wb):
+        """Register the shared PWD named styles on a new workbook"""
+        for style_name, attributes in _NAMED_STYLES:
+            wb.add_named_style(NamedStyle(name=style_name, **attributes))
+    
+    @staticmethod
+    def _styled_cell(ws, value, style_name):
+        """Create a write-only cell using a registered named style"""
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style_name
+        return cell
+    
     @staticmethod
     def create_formatted_excel(data, file_path=None, title="PWD Report"):
         """Create formatted Excel file with PWD styling"""
-        if not OPENPYXL_AVAILABLE:
-            # Fallback to basic Excel without formatting
+        if not OPENPYXL_AVAILABLE or not isinstance(data, pd.DataFrame):
+            # Fallback to basic Excel without formatting; dicts of sheets and
+            # other data have no formatted layout, so skip building one
             return ExcelHandler.write_excel_file(data, file_path)
         
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Report"
+        # Write-only mode streams rows to disk instead of holding a cell grid,
+        # so column widths and merges must be set before rows are appended
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Report")
+        ExcelHandler._add_named_styles(wb)
+        
+        generated_on = f"Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
+        
+        # Decide number format per column once instead of per cell
+        column_styles = []
+        for col_idx, (_, column) in enumerate(data.items(), 1):
+            if col_idx > 1 and pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+                column_styles.append('PWD Amount' if (column > 1000).any() else 'PWD Number')
+                continue
+            # Object columns can also hold date/datetime values (rows read back
+            # from SQLite or built from dicts), which need a date format too
+            inferred = pd.api.types.infer_dtype(column, skipna=True)
+            if inferred in ('datetime', 'datetime64'):
+                column_styles.append('PWD Date')
+            elif inferred == 'date':
+                column_styles.append('PWD Date Only')
+            else:
+                column_styles.append('PWD Data')
+        
+        if len(data.columns):
+            # Auto-adjust column widths from the values about to be written
+            header_lengths = data.columns.astype(str).str.len().to_numpy()
+            value_lengths = np.nan_to_num([column.str.len().max() for _, column in data.astype(str).items()])
+            max_lengths = np.maximum(header_lengths, value_lengths).astype(int)
+            max_lengths[0] = max(max_lengths[0], len(title), len(generated_on))
+            
+            adjusted_widths = np.minimum(max_lengths + 2, 50).tolist()
+            column_letters = [get_column_letter(col_idx) for col_idx in range(1, len(adjusted_widths) + 1)]
+            for letter, width, style_name in zip(column_letters, adjusted_widths, column_styles):
+                ws.column_dimensions[letter].width = width
+                # Numeric columns also carry their format as the column default
+                if style_name == 'PWD Amount':
+                    ws.column_dimensions[letter].number_format = '#,##0.00'
+                elif style_name == 'PWD Number':
+                    ws.column_dimensions[letter].number_format = '0.00'
         
-        # Define styles
-        header_font = Font(name='Arial', size=14, bold=True, color='FFFFFF')
-        header_fill = PatternFill(start_color='004E89', end_color='004E89', fill_type='solid')
+        # Add title
+        ws.merged_cells.add('A1:E1')
+        ws.append([ExcelHandler._styled_cell(ws, title, 'PWD Title')])
         
-        subheader_font = Font(name='Arial', size=12, bold=True, color='FFFFFF')
-        subheader_fill = PatternFill(start_color='FF6B35', end_color='FF6B35', fill_type='solid')
+        # Add generation date
+        ws.merged_cells.add('A2:E2')
+        ws.append([ExcelHandler._styled_cell(ws, generated_on, 'PWD Subtitle')])
         
-        normal_font = Font(name='Arial', size=10)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        # Blank row 3, data starts at row 4
+        ws.append([])
         
-        # Add title
-        ws['A1'] = title
-        ws['A1'].font = Font(name='Arial', size=16, bold=True, color='004E89')
-        ws.merge_cells('A1:E1')
-        ws['A1'].alignment = Alignment(horizontal='center')
+        # Add headers
+        ws.append([ExcelHandler._styled_cell(ws, column_name, 'PWD Header') for column_name in data.columns])
         
-        # Add generation date
-        ws['A2'] = f"Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}"
-        ws['A2'].font = Font(name='Arial', size=10, italic=True)
-        ws.merge_cells('A2:E2')
-        
-        # Add data
-        if isinstance(data, pd.DataFrame):
-            # Add DataFrame
-            start_row = 4
-            
-            # Add headers
-            for col, column_name in enumerate(data.columns, 1):
-                cell = ws.cell(row=start_row, column=col, value=column_name)
-                cell.font = subheader_font
-                cell.fill = subheader_fill
-                cell.border = border
-                cell.alignment = Alignment(horizontal='center')
-            
-            # Add data rows
-            for row_idx, row_data in enumerate(data.iterrows(), start_row + 1):
-                for col_idx, value in enumerate(row_data[1], 1):
-                    cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                    cell.font = normal_font
-                    cell.border = border
-                    
-                    # Format numbers
-                    if isinstance(value, (int, float)) and col_idx > 1:
-                        if value > 1000:
-                            cell.number_format = '#,##0.00'
-                        else:
-                            cell.number_format = '0.00'
-            
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+        # Add data rows
+        for row in data.to_numpy(dtype=object).tolist():
+            ws.append([
+                ExcelHandler._styled_cell(ws, value, style_name)
+                for value, style_name in zip(row, column_styles)
+            ])
         
         # Save or return buffer
-        if file_path is None:
-            buffer = io.BytesIO()
-            wb.save(buffer)
-            buffer.seek(0)
-            return buffer.getvalue()
-        else:
-            wb.save(file_path)
-            return file_path
+        return ExcelHandler._save_workbook(wb, file_path)
     
     @staticmethod
     def create_bill_excel(bill_data, file_path=None):
         """Create formatted Excel file for bill"""
-        # Prepare bill items data
-        if 'items' in bill_data and bill_data['items']:
-            items_df = pd.DataFrame(bill_data['items'])
-            items_df.index += 1
-            items_df.index.name = 'S.No.'
-        else:
-            items_df = pd.DataFrame()
-        
-        # Prepare deductions data
-        if 'deductions' in bill_data and bill_data['deductions']:
-            deductions_df = pd.DataFrame(bill_data['deductions'])
-            deductions_df.index += 1
-            deductions_df.index.name = 'S.No.'
-        else:
-            deductions_df = pd.DataFrame()
+        items_df, deductions_df = ExcelHandler._bill_frames(bill_data)
         
         # Create workbook
         if not OPENPYXL_AVAILABLE:
             # Basic version without formatting
             sheets_data = {}
+            bill_amount = bill_data.get('bill_amount', 0)
+            total_deductions = sum(d.get('amount', 0) for d in bill_data.get('deductions', ()))
             
             # Bill summary
             summary_data = {
@@ -186,9 +271,9 @@ class ExcelHandler:
                     bill_data.get('bill_date', ''),
                     bill_data.get('contractor_name', ''),
                     bill_data.get('project_name', ''),
-                    f"₹{bill_data.get('bill_amount', 0):,.2f}",
-                    f"₹{sum([d.get('amount', 0) for d in bill_data.get('deductions', [])]):,.2f}",
-                    f"₹{bill_data.get('bill_amount', 0) - sum([d.get('amount', 0) for d in bill_data.get('deductions', [])]):,.2f}"
+                    f"₹{bill_amount:,.2f}",
+                    f"₹{total_deductions:,.2f}",
+                    f"₹{bill_amount - total_deductions:,.2f}"
                 ]
             }
             sheets_data['Bill Summary'] = pd.DataFrame(summary_data)
@@ -202,11 +287,11 @@ class ExcelHandler:
             return ExcelHandler.write_excel_file(sheets_data, file_path)
         
         # Formatted version with openpyxl
-        wb = Workbook()
+        wb = Workbook(write_only=True)
+        ExcelHandler._add_named_styles(wb)
         
         # Bill Summary Sheet
-        ws_summary = wb.active
-        ws_summary.title = "Bill Summary"
+        ws_summary = wb.create_sheet("Bill Summary")
         
         # Add bill details
         ExcelHandler._add_bill_summary(ws_summary, bill_data)
@@ -222,54 +307,83 @@ class ExcelHandler:
             ExcelHandler._add_deductions_sheet(ws_deductions, deductions_df)
         
         # Save or return buffer
-        if file_path is None:
-            buffer = io.BytesIO()
-            wb.save(buffer)
-            buffer.seek(0)
-            return buffer.getvalue()
-        else:
-            wb.save(file_path)
-            return file_path
+        return ExcelHandler._save_workbook(wb, file_path)
     
     @staticmethod
-    def _add_bill_summary(ws, bill_data):
-        """Add bill summary to worksheet"""
-        if not OPENPYXL_AVAILABLE:
-            return
+    def _bill_frames(bill_data):
+        """Build the numbered items and deductions DataFrames for a bill"""
+        # Prepare bill items data
+        if 'items' in bill_data and bill_data['items']:
+            items_df = pd.DataFrame(bill_data['items'])
+            items_df.index += 1
+            items_df.index.name = 'S.No.'
+        else:
+            items_df = pd.DataFrame()
         
-        # Styles
-        header_font = Font(name='Arial', size=14, bold=True, color='FFFFFF')
-        header_fill = PatternFill(start_color='004E89', end_color='004E89', fill_type='solid')
-        normal_font = Font(name='Arial', size=11)
+        # Prepare deductions data
+        if 'deductions' in bill_data and bill_data['deductions']:
+            deductions_df = pd.DataFrame(bill_data['deductions'])
+            deductions_df.index += 1
+            deductions_df.index.name = 'S.No.'
+        else:
+            deductions_df = pd.DataFrame()
         
-        # Title
-        ws['A1'] = "PWD BILL SUMMARY"
-        ws['A1'].font = Font(name='Arial', size=16, bold=True, color='004E89')
-        ws.merge_cells('A1:B1')
-        ws['A1'].alignment = Alignment(horizontal='center')
+        return items_df, deductions_df
+    
+    @staticmethod
+    def _bill_summary_details(bill_data):
+        """Label/value pairs shown on the bill summary sheet"""
+        bill_amount = bill_data.get('bill_amount', 0)
+        total_deductions = sum(d.get('amount', 0) for d in bill_data.get('deductions', ()))
         
-        # Bill details
-        details = [
+        return [
             ('Bill Number:', bill_data.get('bill_number', 'N/A')),
             ('Bill Date:', bill_data.get('bill_date', 'N/A')),
             ('Contractor Name:', bill_data.get('contractor_name', 'N/A')),
             ('Project Name:', bill_data.get('project_name', 'N/A')),
             ('Work Order No.:', bill_data.get('work_order_no', 'N/A')),
             ('Agreement Amount:', f"₹{bill_data.get('agreement_amount', 0):,.2f}"),
-            ('Bill Amount:', f"₹{bill_data.get('bill_amount', 0):,.2f}"),
-            ('Total Deductions:', f"₹{sum([d.get('amount', 0) for d in bill_data.get('deductions', [])]):,.2f}"),
-            ('Net Payable Amount:', f"₹{bill_data.get('bill_amount', 0) - sum([d.get('amount', 0) for d in bill_data.get('deductions', [])]):,.2f}")
+            ('Bill Amount:', f"₹{bill_amount:,.2f}"),
+            ('Total Deductions:', f"₹{total_deductions:,.2f}"),
+            ('Net Payable Amount:', f"₹{bill_amount - total_deductions:,.2f}")
         ]
+    
+    @staticmethod
+    def _add_bill_summary(ws, bill_data):
+        """Add bill summary to write-only worksheet"""
+        if not OPENPYXL_AVAILABLE:
+            return
         
-        for idx, (label, value) in enumerate(details, 3):
-            ws[f'A{idx}'] = label
-            ws[f'B{idx}'] = value
-            ws[f'A{idx}'].font = Font(name='Arial', size=11, bold=True)
-            ws[f'B{idx}'].font = normal_font
-        
-        # Auto-adjust column widths
+        # Column widths must be set before any rows are written
         ws.column_dimensions['A'].width = 25
         ws.column_dimensions['B'].width = 30
+        
+        # Title
+        ws.merged_cells.add('A1:B1')
+        ws.append([ExcelHandler._styled_cell(ws, "PWD BILL SUMMARY", 'PWD Title')])
+        ws.append([])
+        
+        # Bill details
+        for label, value in ExcelHandler._bill_summary_details(bill_data):
+            ws.append([
+                ExcelHandler._styled_cell(ws, label, 'PWD Label'),
+                ExcelHandler._styled_cell(ws, value, 'PWD Value')
+            ])
+    
+    @staticmethod
+    def _append_dataframe_sheet(ws, df, title, merge_range, header_style):
+        """Append a titled DataFrame to a write-only worksheet"""
+        # Add title
+        ws.merged_cells.add(merge_range)
+        ws.append([ExcelHandler._styled_cell(ws, title, 'PWD Section Title')])
+        ws.append([])
+        
+        # Styled header on row 3: index name followed by the column names
+        ws.append([ExcelHandler._styled_cell(ws, value, header_style) for value in [df.index.name, *df.columns]])
+        
+        # Data rows go straight to the sheet without per-cell objects
+        for row in df.itertuples(index=True, name=None):
+            ws.append(row)
     
     @staticmethod
     def _add_items_sheet(ws, items_df):
@@ -277,24 +391,7 @@ class ExcelHandler:
         if not OPENPYXL_AVAILABLE:
             return
         
-        # Add title
-        ws['A1'] = "BILL ITEMS"
-        ws['A1'].font = Font(name='Arial', size=14, bold=True, color='004E89')
-        ws.merge_cells('A1:F1')
-        ws['A1'].alignment = Alignment(horizontal='center')
-        
-        # Add DataFrame data starting from row 3
-        for r_idx, row in enumerate(dataframe_to_rows(items_df, index=True, header=True), 3):
-            for c_idx, value in enumerate(row, 1):
-                ws.cell(row=r_idx, column=c_idx, value=value)
-        
-        # Format header row
-        header_row = 4
-        for col in range(1, len(items_df.columns) + 2):
-            cell = ws.cell(row=header_row, column=col)
-            cell.font = Font(name='Arial', size=11, bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color='FF6B35', end_color='FF6B35', fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
+        ExcelHandler._append_dataframe_sheet(ws, items_df, "BILL ITEMS", 'A1:F1', 'PWD Items Header')
     
     @staticmethod
     def _add_deductions_sheet(ws, deductions_df):
@@ -302,24 +399,59 @@ class ExcelHandler:
         if not OPENPYXL_AVAILABLE:
             return
         
-        # Add title
-        ws['A1'] = "DEDUCTIONS"
-        ws['A1'].font = Font(name='Arial', size=14, bold=True, color='004E89')
-        ws.merge_cells('A1:D1')
-        ws['A1'].alignment = Alignment(horizontal='center')
-        
-        # Add DataFrame data starting from row 3
-        for r_idx, row in enumerate(dataframe_to_rows(deductions_df, index=True, header=True), 3):
-            for c_idx, value in enumerate(row, 1):
-                ws.cell(row=r_idx, column=c_idx, value=value)
-        
-        # Format header row
-        header_row = 4
-        for col in range(1, len(deductions_df.columns) + 2):
-            cell = ws.cell(row=header_row, column=col)
-            cell.font = Font(name='Arial', size=11, bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color='1A8A16', end_color='1A8A16', fill_type='solid')
-            cell.alignment = Alignment(horizontal='center')
+        ExcelHandler._append_dataframe_sheet(ws, deductions_df, "DEDUCTIONS", 'A1:D1', 'PWD Deductions Header')
+    
+    @staticmethod
+    def create_bill_excel_fast(bill_data, file_path=None):
+        """Create the bill workbook with xlsxwriter, without openpyxl"""
+        if not XLSXWRITER_AVAILABLE:
+            return ExcelHandler.create_bill_excel(bill_data, file_path)
+        
+        items_df, deductions_df = ExcelHandler._bill_frames(bill_data)
+        buffer = io.BytesIO() if file_path is None else file_path
+        
+        # Same layout and colours as create_bill_excel, written row by row
+        workbook = xlsxwriter.Workbook(buffer, {'strings_to_numbers': False, 'nan_inf_to_errors': True})
+        title_format = workbook.add_format({'font_name': 'Arial', 'font_size': 16, 'bold': True, 'font_color': '#004E89', 'align': 'center'})
+        section_format = workbook.add_format({'font_name': 'Arial', 'font_size': 14, 'bold': True, 'font_color': '#004E89', 'align': 'center'})
+        label_format = workbook.add_format({'font_name': 'Arial', 'font_size': 11, 'bold': True})
+        value_format = workbook.add_format({'font_name': 'Arial', 'font_size': 11})
+        header_formats = {
+            color: workbook.add_format({'font_name': 'Arial', 'font_size': 11, 'bold': True, 'font_color': '#FFFFFF',
+                                        'bg_color': color, 'pattern': 1, 'align': 'center'})
+            for color in ('#FF6B35', '#1A8A16')
+        }
+        datetime_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+        date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+        
+        # Bill Summary Sheet
+        worksheet = workbook.add_worksheet("Bill Summary")
+        worksheet.set_column(0, 0, 25)
+        worksheet.set_column(1, 1, 30)
+        worksheet.merge_range(0, 0, 0, 1, "PWD BILL SUMMARY", title_format)
+        for row_idx, (label, value) in enumerate(ExcelHandler._bill_summary_details(bill_data), 2):
+            worksheet.write_string(row_idx, 0, label, label_format)
+            ExcelHandler._write_cell(worksheet, row_idx, 1, value, datetime_format, date_format, value_format)
+        
+        # Items and deductions sheets, header on row 3 and data below it
+        for sheet_name, df, title, last_col, color in (
+            ("Bill Items", items_df, "BILL ITEMS", 5, '#FF6B35'),
+            ("Deductions", deductions_df, "DEDUCTIONS", 3, '#1A8A16'),
+        ):
+            if df.empty:
+                continue
+            
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.merge_range(0, 0, 0, last_col, title, section_format)
+            worksheet.write_row(2, 0, [df.index.name, *df.columns], header_formats[color])
+            for row_idx, (index, row) in enumerate(zip(df.index.tolist(), df.to_numpy(dtype=object).tolist()), 3):
+                worksheet.write(row_idx, 0, index)
+                for col_idx, value in enumerate(row, 1):
+                    ExcelHandler._write_cell(worksheet, row_idx, col_idx, value, datetime_format, date_format)
+        
+        workbook.close()
+        
+        return buffer.getvalue() if file_path is None else file_path
     
     @staticmethod
     def process_emd_excel(file_path_or_buffer):
@@ -334,27 +466,26 @@ class ExcelHandler:
             ]
             
             # Validate columns
-            missing_columns = []
-            for col in expected_columns:
-                if col not in df.columns.str.lower().str.replace(' ', '_'):
-                    missing_columns.append(col)
+            normalized_columns = frozenset(df.columns.str.lower().str.replace(' ', '_'))
+            missing_columns = [col for col in expected_columns if col not in normalized_columns]
             
             if missing_columns:
                 return None, f"Missing columns: {', '.join(missing_columns)}"
             
-            # Clean and validate data
-            processed_df = df.copy()
+            # Clean and validate data; df was read here, so it is mutated in place
+            processed_df = df
             
-            # Convert date columns
+            # Convert date columns; cells stored as Excel dates are already
+            # datetime64 after reading and need no second pass
             date_columns = ['deposit_date']
             for col in date_columns:
-                if col in processed_df.columns:
+                if col in processed_df.columns and not pd.api.types.is_datetime64_any_dtype(processed_df[col]):
                     processed_df[col] = pd.to_datetime(processed_df[col], errors='coerce')
             
-            # Convert numeric columns
+            # Convert numeric columns, skipping those read as numbers
             numeric_columns = ['emd_amount']
             for col in numeric_columns:
-                if col in processed_df.columns:
+                if col in processed_df.columns and not pd.api.types.is_numeric_dtype(processed_df[col]):
                     processed_df[col] = pd.to_numeric(processed_df[col], errors='coerce')
             
             # Remove rows with critical missing data
@@ -381,38 +512,55 @@ class ExcelHandler:
             'Remarks': ['Sample data', 'Sample data']
         }
         
-        template_df = pd.DataFrame(template_data)
-        
         # Create instructions
-        instructions = pd.DataFrame({
-            'EMD Processing Template Instructions': [
-                'This template is for processing EMD (Earnest Money Deposit) data',
-                '',
-                'Required Columns:',
-                '- Tender Number: Unique identifier for each tender',
-                '- Contractor/Bidder Name: Name of the bidding organization',
-                '- EMD Amount: Amount in rupees (numeric)',
-                '- Deposit Date: Date in YYYY-MM-DD format',
-                '',
-                'Optional Columns:',
-                '- All other columns as per requirement',
-                '',
-                'Notes:',
-                '- Do not modify the header row',
-                '- Ensure dates are in proper format',
-                '- EMD amounts should be numeric without currency symbols',
-                '',
-                f'Template created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
-            ]
-        })
-        
-        # Combine data
-        sheets_data = {
-            'EMD_Data': template_df,
-            'Instructions': instructions
-        }
+        instructions_title = 'EMD Processing Template Instructions'
+        instructions = [
+            'This template is for processing EMD (Earnest Money Deposit) data',
+            '',
+            'Required Columns:',
+            '- Tender Number: Unique identifier for each tender',
+            '- Contractor/Bidder Name: Name of the bidding organization',
+            '- EMD Amount: Amount in rupees (numeric)',
+            '- Deposit Date: Date in YYYY-MM-DD format',
+            '',
+            'Optional Columns:',
+            '- All other columns as per requirement',
+            '',
+            'Notes:',
+            '- Do not modify the header row',
+            '- Ensure dates are in proper format',
+            '- EMD amounts should be numeric without currency symbols',
+            '',
+            f'Template created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
+        ]
         
-        return ExcelHandler.write_excel_file(sheets_data)
+        if not XLSXWRITER_AVAILABLE:
+            # Combine data
+            sheets_data = {
+                'EMD_Data': pd.DataFrame(template_data),
+                'Instructions': pd.DataFrame({instructions_title: instructions})
+            }
+            return ExcelHandler.write_excel_file(sheets_data)
+        
+        # Both sheets are tiny and fixed, so write them directly instead of
+        # building DataFrames only to serialise them
+        buffer = io.BytesIO()
+        workbook = xlsxwriter.Workbook(buffer)
+        header_format = workbook.add_format(_PLAIN_HEADER_FORMAT)
+        
+        worksheet = workbook.add_worksheet('EMD_Data')
+        worksheet.write_row(0, 0, list(template_data), header_format)
+        for col_idx, values in enumerate(template_data.values()):
+            worksheet.write_column(1, col_idx, values)
+        
+        worksheet = workbook.add_worksheet('Instructions')
+        worksheet.write_string(0, 0, instructions_title, header_format)
+        for row_idx, line in enumerate(instructions, 1):
+            if line:
+                worksheet.write_string(row_idx, 0, line)
+        
+        workbook.close()
+        return buffer.getvalue()
     
     @staticmethod
     def validate_excel_structure(df, required_columns):
@@ -426,13 +574,10 @@ class ExcelHandler:
             return errors, warnings
         
         # Check for required columns
-        df_columns = df.columns.str.lower().str.replace(' ', '_')
+        normalized_columns = frozenset(df.columns.str.lower().str.replace(' ', '_'))
         required_lower = [col.lower().replace(' ', '_') for col in required_columns]
         
-        missing_columns = []
-        for req_col in required_lower:
-            if req_col not in df_columns:
-                missing_columns.append(req_col)
+        missing_columns = [req_col for req_col in required_lower if req_col not in normalized_columns]
         
         if missing_columns:
             errors.append(f"Missing required columns: {', '.join(missing_columns)}")
@@ -450,17 +595,18 @@ class ExcelHandler:
         for col in df.columns:
             col_lower = col.lower().replace(' ', '_')
             
-            # Check date columns
-            if 'date' in col_lower:
+            # Probe a sample of non-empty values; a bad value near the top
+            # is enough to warn, so whole columns are never parsed here
+            if 'date' in col_lower and not pd.api.types.is_datetime64_any_dtype(df[col]):
                 try:
-                    pd.to_datetime(df[col], errors='raise')
+                    pd.to_datetime(df[col].dropna().head(50), errors='raise')
                 except:
                     warnings.append(f"Column '{col}' may contain invalid dates")
             
             # Check amount columns
-            if 'amount' in col_lower or 'value' in col_lower:
+            if ('amount' in col_lower or 'value' in col_lower) and not pd.api.types.is_numeric_dtype(df[col]):
                 try:
-                    pd.to_numeric(df[col], errors='raise')
+                    pd.to_numeric(df[col].dropna().head(50), errors='raise')
                 except:
                     warnings.append(f"Column '{col}' may contain non-numeric values")
         
@@ -469,19 +615,20 @@ class ExcelHandler:
     @staticmethod
     def clean_excel_data(df):
         """Clean Excel data for processing"""
-        cleaned_df = df.copy()
-        
-        # Remove completely empty rows
-        cleaned_df = cleaned_df.dropna(how='all')
+        # Remove completely empty rows (dropna returns a new frame, so the
+        # caller's DataFrame is never modified and needs no upfront copy)
+        cleaned_df = df.dropna(how='all')
         
         # Remove completely empty columns
         cleaned_df = cleaned_df.dropna(axis=1, how='all')
         
-        # Strip whitespace from string columns
-        for col in cleaned_df.select_dtypes(include=['object']).columns:
-            cleaned_df[col] = cleaned_df[col].astype(str).str.strip()
-            # Replace 'nan' strings with actual NaN
-            cleaned_df[col] = cleaned_df[col].replace('nan', pd.NA)
+        # Strip whitespace from string columns in a single assignment,
+        # replacing 'nan' strings with actual NaN
+        object_columns = cleaned_df.select_dtypes(include=['object']).columns
+        if len(object_columns):
+            cleaned_df[object_columns] = cleaned_df[object_columns].apply(
+                lambda column: column.astype(str).str.strip().replace('nan', pd.NA)
+            )
         
         # Convert date-like columns
         date_keywords = ['date', 'time']
@@ -497,9 +644,11 @@ class ExcelHandler:
         for col in cleaned_df.columns:
             if any(keyword in col.lower() for keyword in numeric_keywords):
                 try:
-                    # Remove currency symbols and commas
+                    # Remove currency symbols and commas, skipping columns without any
                     if cleaned_df[col].dtype == 'object':
-                        cleaned_df[col] = cleaned_df[col].astype(str).str.replace('[₹,\$]', '', regex=True)
+                        text = cleaned_df[col].astype(str)
+                        if text.str.contains(_CURRENCY_RE).any():
+                            cleaned_df[col] = text.str.replace(_CURRENCY_RE, '', regex=True)
                     cleaned_df[col] = pd.to_numeric(cleaned_df[col], errors='coerce')
                 except:
                     pass
@@ -514,11 +663,8 @@ def create_excel_from_dict(data_dict, filename=None):
 def read_excel_sheets(file_path_or_buffer):
     """Read all sheets from Excel file"""
     try:
-        excel_file = pd.ExcelFile(file_path_or_buffer)
-        sheets_data = {}
-        
-        for sheet_name in excel_file.sheet_names:
-            sheets_data[sheet_name] = pd.read_excel(excel_file, sheet_name=sheet_name)
+        # sheet_name=None parses every sheet from one read-only workbook
+        sheets_data = ExcelHandler.read_excel_file(file_path_or_buffer, sheet_name=None)
         
         return sheets_data, None
     except Exception as e:
@@ -530,27 +676,56 @@ def get_excel_info(file_path_or_buffer):
         if hasattr(file_path_or_buffer, 'read'):
             # File buffer
             file_size = len(file_path_or_buffer.getvalue())
-            excel_file = pd.ExcelFile(file_path_or_buffer)
         else:
             # File path
             file_size = os.path.getsize(file_path_or_buffer)
-            excel_file = pd.ExcelFile(file_path_or_buffer)
         
-        info = {
-            'file_size': file_size,
-            'sheet_names': excel_file.sheet_names,
-            'sheet_count': len(excel_file.sheet_names),
-            'sheets_info': {}
-        }
+        if not OPENPYXL_AVAILABLE:
+            return None, "Error getting Excel file info: openpyxl is not installed"
         
-        # Get info for each sheet
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
-            info['sheets_info'][sheet_name] = {
-                'rows': len(df),
-                'columns': len(df.columns),
-                'column_names': list(df.columns)
+        # Only sheet dimensions and the header row are needed, so read the
+        # workbook metadata in read-only mode instead of parsing every sheet
+        wb = load_workbook(file_path_or_buffer, read_only=True, data_only=True)
+        try:
+            info = {
+                'file_size': file_size,
+                'sheet_names': wb.sheetnames,
+                'sheet_count': len(wb.sheetnames),
+                'sheets_info': {}
             }
+            
+            # Get info for each sheet
+            for sheet_name in wb.sheetnames:
+                ws = wb[sheet_name]
+                if ws.max_row is None:
+                    # Dimensions missing from the file, so scan the rows
+                    # instead; an empty sheet yields no rows at all
+                    ws.reset_dimensions()
+                    row_count, max_column, header = 0, 0, ()
+                    for row in ws.iter_rows(values_only=True):
+                        if not row_count:
+                            header = row
+                        row_count += 1
+                        max_column = max(max_column, len(row))
+                    header = tuple(header) + (None,) * (max_column - len(header))
+                else:
+                    row_count = ws.max_row
+                    header = next(ws.iter_rows(max_row=1, max_col=ws.max_column, values_only=True), ())
+                
+                rows = max(row_count - 1, 0)
+                if not rows and all(value is None for value in header):
+                    header = ()
+                
+                info['sheets_info'][sheet_name] = {
+                    'rows': rows,
+                    'columns': len(header),
+                    'column_names': [
+                        value if value is not None else f"Unnamed: {idx}"
+                        for idx, value in enumerate(header)
+                    ]
+                }
+        finally:
+            wb.close()
         
         return info, None
     except Exception as e:
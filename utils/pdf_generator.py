@@ -3,66 +3,260 @@ PDF Generation utilities for PWD Tools
 Generate PDF documents for bills, reports, and certificates
 """
 
-try:
-    from reportlab.lib.pagesizes import letter, A4
+import copy
+import html
+import importlib.util
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# ReportLab is imported on first use so the text reports never load it
+REPORTLAB_AVAILABLE = importlib.util.find_spec('reportlab') is not None
+_REPORTLAB_LOADED = False
+
+# Optional HTML-based backend for high-volume generation
+PYMUPDF_AVAILABLE = importlib.util.find_spec('pymupdf') is not None
+
+# Format of the "generated on" stamp in every PDF and text report
+_TIMESTAMP_FORMAT = '%d/%m/%Y %H:%M:%S'
+
+def _generated_on():
+    """Return the current time formatted for document footers"""
+    return datetime.now().strftime(_TIMESTAMP_FORMAT)
+
+# Fonts used by every document's styles and tables
+_PDF_FONTS = ('Helvetica', 'Helvetica-Bold')
+
+def _load_reportlab():
+    """Import ReportLab and set up fonts and shared table styles once"""
+    global _REPORTLAB_LOADED
+    global A4, colors, getSampleStyleSheet, ParagraphStyle, inch
+    global SimpleDocTemplate, Table, Paragraph, Spacer, TA_CENTER
+    global _BILL_DETAILS_STYLE, _BILL_ITEMS_STYLE, _BILL_DEDUCTIONS_STYLE, _BILL_SUMMARY_STYLE
+    global _BILL_SIGNATURE_STYLE, _EMD_DETAILS_STYLE, _EMD_SIGNATURE_STYLE
+    global _PROJECT_DETAILS_STYLE, _PROGRESS_STYLE, _ITEMS_COL_WIDTHS
+    global _C_BLUE, _C_ORANGE, _C_GRAY, _C_GREEN
+    if _REPORTLAB_LOADED:
+        return
+    
+    from reportlab.lib.pagesizes import A4
     from reportlab.lib import colors
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab import rl_config
+    from reportlab.pdfbase import pdfmetrics
+    
+    if not os.environ.get('PWD_PDF_DEBUG'):
+        # Attribute validation is only useful while developing layouts
+        rl_config.shapeChecking = 0
+    
+    # Load the standard font metrics now instead of on first use in a build
+    for font_name in _PDF_FONTS:
+        pdfmetrics.getFont(font_name)
+    
+    # PWD palette shared by the stylesheet and the table styles
+    _C_BLUE = colors.HexColor('#004E89')
+    _C_ORANGE = colors.HexColor('#FF6B35')
+    _C_GRAY = colors.HexColor('#F0F2F6')
+    _C_GREEN = colors.HexColor('#1A8A16')
+    
+    # Table styles are the same for every document, so build them once
+    _BILL_DETAILS_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), _C_GRAY),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    _BILL_ITEMS_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), _C_BLUE),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    _BILL_DEDUCTIONS_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), _C_ORANGE),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('BACKGROUND', (0, -1), (-1, -1), _C_GRAY),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('ALIGN', (0, 1), (0, -2), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (-1, -2), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    _BILL_SUMMARY_STYLE = TableStyle([
+        ('BACKGROUND', (0, -1), (-1, -1), _C_GREEN),
+        ('TEXTCOLOR', (0, -1), (-1, -1), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -2), 'Helvetica'),
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    _BILL_SIGNATURE_STYLE = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
+    ])
+    _EMD_DETAILS_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), _C_GRAY),
+        ('BACKGROUND', (0, -1), (-1, -1), _C_GREEN),
+        ('TEXTCOLOR', (0, -1), (-1, -1), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -2), 'Helvetica'),
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    _EMD_SIGNATURE_STYLE = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
+    ])
+    _PROJECT_DETAILS_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), _C_GRAY),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    _PROGRESS_STYLE = _PROJECT_DETAILS_STYLE
+    _ITEMS_COL_WIDTHS = [0.5*inch, 2.5*inch, 0.8*inch, 0.8*inch, 1*inch, 1*inch]
+    
+    _REPORTLAB_LOADED = True
 
-import io
-from datetime import datetime
-import pandas as pd
+class _PDFSink:
+    """Write target that keeps the chunks ReportLab hands it without copying"""
+    __slots__ = ('chunks',)
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+        return len(data)
+
+    def getvalue(self):
+        if len(self.chunks) == 1:
+            return bytes(self.chunks[0])
+        return b''.join(self.chunks)
+
+# Long item lists are split into tables of this many rows; ReportLab's
+# split/layout cost grows faster than linearly with table height
+_ITEMS_TABLE_CHUNK_ROWS = 50
 
 class PDFGenerator:
     """PDF generation utility class"""
     
+    # Stylesheet shared by every generator, built on first use
+    _STYLES = None
+    
+    # Parsed paragraphs for fixed text, keyed by (text, style name)
+    _STATIC_PARAGRAPHS = {}
+    
+    # Parsed footer fragments keyed by (label, tool name); only the timestamp varies
+    _FOOTER_FRAGS = {}
+    
     def __init__(self):
         """Initialize PDF generator"""
         if not REPORTLAB_AVAILABLE:
             raise ImportError("ReportLab is required for PDF generation. Install with: pip install reportlab")
         
-        self.styles = getSampleStyleSheet()
-        self.setup_custom_styles()
+        _load_reportlab()
+        self.styles = self._get_styles()
+    
+    @classmethod
+    def _get_styles(cls):
+        """Return the shared stylesheet, building it once per process"""
+        if cls._STYLES is None:
+            styles = getSampleStyleSheet()
+            cls._add_custom_styles(styles)
+            cls._STYLES = styles
+        return cls._STYLES
+    
+    def _static_paragraph(self, text, style_name):
+        """Return a fresh copy of a paragraph whose markup is parsed only once"""
+        key = (text, style_name)
+        paragraph = self._STATIC_PARAGRAPHS.get(key)
+        if paragraph is None:
+            paragraph = Paragraph(text, self.styles[style_name])
+            self._STATIC_PARAGRAPHS[key] = paragraph
+        # Layout state is stored on the flowable, so each build gets its own copy
+        return copy.copy(paragraph)
+    
+    def _footer_paragraph(self, label, tool_name):
+        """Return the 'generated on' footer, reusing the parsed markup for its label"""
+        style = self.styles['Normal']
+        timestamp = _generated_on()
+        text = f"{label}: {timestamp}<br/>{tool_name}"
+        key = (label, tool_name)
+        frags = self._FOOTER_FRAGS.get(key)
+        if frags is None:
+            frags = Paragraph(f"{label}: <br/>{tool_name}", style).frags
+            self._FOOTER_FRAGS[key] = frags
+        # The timestamp has no markup, so it can be appended to the first fragment
+        first = frags[0].clone(text=frags[0].text + timestamp)
+        return Paragraph(text, style, frags=[first] + frags[1:])
     
     def setup_custom_styles(self):
         """Setup custom styles for PWD documents"""
+        # The custom styles live on the shared stylesheet, added when it is built
+        self.styles = self._get_styles()
+    
+    @staticmethod
+    def _add_custom_styles(styles):
+        """Add the PWD paragraph styles to a stylesheet"""
         # PWD Header style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='PWDHeader',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=18,
-            textColor=colors.HexColor('#004E89'),
+            textColor=_C_BLUE,
             alignment=TA_CENTER,
             spaceAfter=12
         ))
         
         # PWD Subheader style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='PWDSubHeader',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=14,
-            textColor=colors.HexColor('#FF6B35'),
+            textColor=_C_ORANGE,
             alignment=TA_CENTER,
             spaceAfter=8
         ))
         
         # PWD Normal style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='PWDNormal',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=11,
             spaceAfter=6
         ))
         
         # PWD Table Header style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='PWDTableHeader',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             textColor=colors.white,
             alignment=TA_CENTER
@@ -70,17 +264,29 @@ class PDFGenerator:
     
     def create_bill_pdf(self, bill_data, output_path=None):
         """Generate PDF for bill document"""
-        if output_path is None:
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4)
-        else:
-            doc = SimpleDocTemplate(output_path, pagesize=A4)
+        if output_path is not None:
+            self.create_bill_pdf_stream(bill_data, output_path)
+            return output_path
+        
+        buffer = _PDFSink()
+        self.create_bill_pdf_stream(bill_data, buffer)
+        return buffer.getvalue()
+    
+    def create_bill_pdf_stream(self, bill_data, fp):
+        """Write the bill PDF straight to a file-like object or path"""
+        doc = SimpleDocTemplate(fp, pagesize=A4)
+        
+        # Amounts used in several places below
+        bill_amount = bill_data.get('bill_amount', 0)
+        deductions = bill_data.get('deductions') or []
+        total_deductions = sum(d.get('amount', 0) for d in deductions)
+        net_amount = bill_amount - total_deductions
         
         # Build content
         story = []
         
         # Header
-        header = Paragraph("राजस्थान सरकार<br/>लोक निर्माण विभाग<br/>Government of Rajasthan<br/>Public Works Department", self.styles['PWDHeader'])
+        header = self._static_paragraph("राजस्थान सरकार<br/>लोक निर्माण विभाग<br/>Government of Rajasthan<br/>Public Works Department", 'PWDHeader')
         story.append(header)
         story.append(Spacer(1, 12))
         
@@ -96,19 +302,11 @@ class PDFGenerator:
             ['Project Name:', bill_data.get('project_name', 'N/A')],
             ['Work Order No.:', bill_data.get('work_order_no', 'N/A')],
             ['Agreement Amount:', f"₹{bill_data.get('agreement_amount', 0):,.2f}"],
-            ['Bill Amount:', f"₹{bill_data.get('bill_amount', 0):,.2f}"]
+            ['Bill Amount:', f"₹{bill_amount:,.2f}"]
         ]
         
         details_table = Table(bill_details, colWidths=[2*inch, 4*inch])
-        details_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F2F6')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        details_table.setStyle(_BILL_DETAILS_STYLE)
         
         story.append(details_table)
         story.append(Spacer(1, 12))
@@ -121,7 +319,7 @@ class PDFGenerator:
         
         # Bill items table
         if 'items' in bill_data and bill_data['items']:
-            items_header = Paragraph("Bill Items", self.styles['PWDSubHeader'])
+            items_header = self._static_paragraph("Bill Items", 'PWDSubHeader')
             story.append(items_header)
             
             # Create items table
@@ -137,78 +335,53 @@ class PDFGenerator:
                     f"{item.get('total', 0):,.2f}"
                 ])
             
-            items_table = Table(items_data, colWidths=[0.5*inch, 2.5*inch, 0.8*inch, 0.8*inch, 1*inch, 1*inch])
-            items_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#004E89')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            
-            story.append(items_table)
+            if len(items_data) > _ITEMS_TABLE_CHUNK_ROWS:
+                header_row = items_data[0]
+                for start in range(1, len(items_data), _ITEMS_TABLE_CHUNK_ROWS):
+                    if start > 1:
+                        story.append(Spacer(1, 6))
+                    chunk = [header_row] + items_data[start:start + _ITEMS_TABLE_CHUNK_ROWS]
+                    items_table = Table(chunk, colWidths=_ITEMS_COL_WIDTHS)
+                    items_table.setStyle(_BILL_ITEMS_STYLE)
+                    story.append(items_table)
+            else:
+                items_table = Table(items_data, colWidths=_ITEMS_COL_WIDTHS)
+                items_table.setStyle(_BILL_ITEMS_STYLE)
+                story.append(items_table)
             story.append(Spacer(1, 12))
         
         # Deductions table
-        if 'deductions' in bill_data and bill_data['deductions']:
-            deductions_header = Paragraph("Deductions", self.styles['PWDSubHeader'])
+        if deductions:
+            deductions_header = self._static_paragraph("Deductions", 'PWDSubHeader')
             story.append(deductions_header)
             
             deductions_data = [['Deduction Type', 'Rate (%)', 'Amount (₹)']]
-            total_deductions = 0
             
-            for deduction in bill_data['deductions']:
+            for deduction in deductions:
+                rate = deduction.get('rate', 0)
                 deductions_data.append([
                     deduction.get('type', ''),
-                    f"{deduction.get('rate', 0):.2f}%" if deduction.get('rate', 0) > 0 else 'Fixed',
+                    f"{rate:.2f}%" if rate > 0 else 'Fixed',
                     f"{deduction.get('amount', 0):,.2f}"
                 ])
-                total_deductions += deduction.get('amount', 0)
             
             deductions_data.append(['Total Deductions', '', f"{total_deductions:,.2f}"])
             
             deductions_table = Table(deductions_data, colWidths=[3*inch, 1.5*inch, 2*inch])
-            deductions_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF6B35')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#F0F2F6')),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('ALIGN', (0, 1), (0, -2), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -2), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            deductions_table.setStyle(_BILL_DEDUCTIONS_STYLE)
             
             story.append(deductions_table)
             story.append(Spacer(1, 12))
         
         # Summary
-        net_amount = bill_data.get('bill_amount', 0) - sum([d.get('amount', 0) for d in bill_data.get('deductions', [])])
-        
         summary_data = [
-            ['Bill Amount:', f"₹{bill_data.get('bill_amount', 0):,.2f}"],
-            ['Total Deductions:', f"₹{sum([d.get('amount', 0) for d in bill_data.get('deductions', [])]):,.2f}"],
+            ['Bill Amount:', f"₹{bill_amount:,.2f}"],
+            ['Total Deductions:', f"₹{total_deductions:,.2f}"],
             ['Net Payable Amount:', f"₹{net_amount:,.2f}"]
         ]
         
         summary_table = Table(summary_data, colWidths=[3*inch, 2*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#1A8A16')),
-            ('TEXTCOLOR', (0, -1), (-1, -1), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -2), 'Helvetica'),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        summary_table.setStyle(_BILL_SUMMARY_STYLE)
         
         story.append(summary_table)
         story.append(Spacer(1, 20))
@@ -220,44 +393,43 @@ class PDFGenerator:
         ]
         
         signature_table = Table(signature_data, colWidths=[2.2*inch, 2.2*inch, 2.2*inch])
-        signature_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
-        ]))
+        signature_table.setStyle(_BILL_SIGNATURE_STYLE)
         
         story.append(signature_table)
         
         # Footer
-        footer = Paragraph(
-            f"Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}<br/>PWD Tools - Bill Generator",
-            self.styles['Normal']
-        )
+        footer = self._footer_paragraph("Generated on", "PWD Tools - Bill Generator")
         story.append(Spacer(1, 20))
         story.append(footer)
         
         # Build PDF
         doc.build(story)
-        
-        if output_path is None:
-            buffer.seek(0)
-            return buffer.getvalue()
-        
-        return output_path
     
     def create_emd_refund_pdf(self, emd_data, output_path=None):
         """Generate PDF for EMD refund certificate"""
-        if output_path is None:
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4)
-        else:
-            doc = SimpleDocTemplate(output_path, pagesize=A4)
+        if output_path is not None:
+            self.create_emd_refund_pdf_stream(emd_data, output_path)
+            return output_path
+        
+        buffer = _PDFSink()
+        self.create_emd_refund_pdf_stream(emd_data, buffer)
+        return buffer.getvalue()
+    
+    def create_emd_refund_pdf_stream(self, emd_data, fp):
+        """Write the EMD refund certificate straight to a file-like object or path"""
+        doc = SimpleDocTemplate(fp, pagesize=A4)
+        
+        # Values used in both the details table and the calculation text
+        emd_amount = emd_data.get('emd_amount', 0)
+        interest_rate = emd_data.get('interest_rate', 0)
+        interest_amount = emd_data.get('interest_amount', 0)
+        total_refund = emd_data.get('total_refund', 0)
+        days_held = emd_data.get('days_held', 0)
         
         story = []
         
         # Header
-        header = Paragraph("राजस्थान सरकार<br/>लोक निर्माण विभाग<br/>EMD REFUND CERTIFICATE", self.styles['PWDHeader'])
+        header = self._static_paragraph("राजस्थान सरकार<br/>लोक निर्माण विभाग<br/>EMD REFUND CERTIFICATE", 'PWDHeader')
         story.append(header)
         story.append(Spacer(1, 20))
         
@@ -265,48 +437,38 @@ class PDFGenerator:
         emd_details = [
             ['Tender Number:', emd_data.get('tender_number', 'N/A')],
             ['Contractor/Bidder Name:', emd_data.get('contractor_name', 'N/A')],
-            ['EMD Amount:', f"₹{emd_data.get('emd_amount', 0):,.2f}"],
+            ['EMD Amount:', f"₹{emd_amount:,.2f}"],
             ['Deposit Date:', emd_data.get('deposit_date', 'N/A')],
             ['Refund Date:', emd_data.get('refund_date', 'N/A')],
-            ['Interest Rate:', f"{emd_data.get('interest_rate', 0):.2f}% per annum"],
-            ['Interest Amount:', f"₹{emd_data.get('interest_amount', 0):,.2f}"],
-            ['Total Refund Amount:', f"₹{emd_data.get('total_refund', 0):,.2f}"]
+            ['Interest Rate:', f"{interest_rate:.2f}% per annum"],
+            ['Interest Amount:', f"₹{interest_amount:,.2f}"],
+            ['Total Refund Amount:', f"₹{total_refund:,.2f}"]
         ]
         
         details_table = Table(emd_details, colWidths=[2.5*inch, 3.5*inch])
-        details_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F2F6')),
-            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#1A8A16')),
-            ('TEXTCOLOR', (0, -1), (-1, -1), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -2), 'Helvetica'),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        details_table.setStyle(_EMD_DETAILS_STYLE)
         
         story.append(details_table)
         story.append(Spacer(1, 20))
         
         # Calculation details
-        if emd_data.get('days_held'):
+        if days_held:
             calc_para = Paragraph(
                 f"<b>Calculation Details:</b><br/>"
-                f"EMD Amount: ₹{emd_data.get('emd_amount', 0):,.2f}<br/>"
-                f"Days Held: {emd_data.get('days_held', 0)} days<br/>"
-                f"Interest Calculation: ₹{emd_data.get('emd_amount', 0):,.2f} × {emd_data.get('interest_rate', 0):.2f}% × {emd_data.get('days_held', 0)}/365<br/>"
-                f"Interest Amount: ₹{emd_data.get('interest_amount', 0):,.2f}<br/>"
-                f"Total Refund: ₹{emd_data.get('total_refund', 0):,.2f}",
+                f"EMD Amount: ₹{emd_amount:,.2f}<br/>"
+                f"Days Held: {days_held} days<br/>"
+                f"Interest Calculation: ₹{emd_amount:,.2f} × {interest_rate:.2f}% × {days_held}/365<br/>"
+                f"Interest Amount: ₹{interest_amount:,.2f}<br/>"
+                f"Total Refund: ₹{total_refund:,.2f}",
                 self.styles['PWDNormal']
             )
             story.append(calc_para)
             story.append(Spacer(1, 20))
         
         # Certification
-        certification = Paragraph(
+        certification = self._static_paragraph(
             "This is to certify that the above EMD refund has been calculated correctly and is approved for payment.",
-            self.styles['PWDNormal']
+            'PWDNormal'
         )
         story.append(certification)
         story.append(Spacer(1, 30))
@@ -319,44 +481,36 @@ class PDFGenerator:
         ]
         
         signature_table = Table(signature_data, colWidths=[2.2*inch, 2.2*inch, 2.2*inch])
-        signature_table.setStyle(TableStyle([
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
-        ]))
+        signature_table.setStyle(_EMD_SIGNATURE_STYLE)
         
         story.append(signature_table)
         
         # Footer
-        footer = Paragraph(
-            f"Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}<br/>PWD Tools - EMD Refund Calculator",
-            self.styles['Normal']
-        )
+        footer = self._footer_paragraph("Generated on", "PWD Tools - EMD Refund Calculator")
         story.append(Spacer(1, 30))
         story.append(footer)
         
         # Build PDF
         doc.build(story)
-        
-        if output_path is None:
-            buffer.seek(0)
-            return buffer.getvalue()
-        
-        return output_path
     
     def create_project_report_pdf(self, project_data, output_path=None):
         """Generate PDF for project financial report"""
-        if output_path is None:
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4)
-        else:
-            doc = SimpleDocTemplate(output_path, pagesize=A4)
+        if output_path is not None:
+            self.create_project_report_pdf_stream(project_data, output_path)
+            return output_path
+        
+        buffer = _PDFSink()
+        self.create_project_report_pdf_stream(project_data, buffer)
+        return buffer.getvalue()
+    
+    def create_project_report_pdf_stream(self, project_data, fp):
+        """Write the project financial report straight to a file-like object or path"""
+        doc = SimpleDocTemplate(fp, pagesize=A4)
         
         story = []
         
         # Header
-        header = Paragraph("PROJECT FINANCIAL REPORT<br/>PWD - Public Works Department", self.styles['PWDHeader'])
+        header = self._static_paragraph("PROJECT FINANCIAL REPORT<br/>PWD - Public Works Department", 'PWDHeader')
         story.append(header)
         story.append(Spacer(1, 20))
         
@@ -372,21 +526,14 @@ class PDFGenerator:
         ]
         
         details_table = Table(project_details, colWidths=[2.5*inch, 3.5*inch])
-        details_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F2F6')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        details_table.setStyle(_PROJECT_DETAILS_STYLE)
         
         story.append(details_table)
         story.append(Spacer(1, 20))
         
         # Progress summary
         if 'physical_progress' in project_data:
-            progress_header = Paragraph("Progress Summary", self.styles['PWDSubHeader'])
+            progress_header = self._static_paragraph("Progress Summary", 'PWDSubHeader')
             story.append(progress_header)
             
             progress_data = [
@@ -396,94 +543,371 @@ class PDFGenerator:
             ]
             
             progress_table = Table(progress_data, colWidths=[2.5*inch, 3.5*inch])
-            progress_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F2F6')),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+            progress_table.setStyle(_PROGRESS_STYLE)
             
             story.append(progress_table)
             story.append(Spacer(1, 20))
         
         # Footer
-        footer = Paragraph(
-            f"Report Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}<br/>"
-            f"PWD Tools - Financial Analysis Module",
-            self.styles['Normal']
-        )
+        footer = self._footer_paragraph("Report Generated on", "PWD Tools - Financial Analysis Module")
         story.append(footer)
         
         # Build PDF
         doc.build(story)
+
+class PDFGeneratorPyMuPDF:
+    """PDF generator that lays out HTML with PyMuPDF, for large batches of documents"""
+    
+    # A4 in points, with the same 72pt margins SimpleDocTemplate uses
+    PAGE_RECT = (0, 0, 595.27, 841.89)
+    CONTENT_RECT = (72, 72, 523.27, 769.89)
+    
+    CSS = """
+        body { font-family: sans-serif; font-size: 10pt; }
+        h1 { font-size: 18pt; color: #004E89; text-align: center; margin: 0 0 12pt 0; }
+        h2 { font-size: 14pt; color: #FF6B35; text-align: center; margin: 8pt 0; }
+        p { font-size: 11pt; margin: 0 0 6pt 0; }
+        table { border-spacing: 0; margin: 0 auto 12pt auto; }
+        td, th { border: 1px solid black; padding: 3pt 6pt; }
+        th { background-color: #004E89; color: white; }
+        td.label { background-color: #F0F2F6; }
+        tr.total td { background-color: #1A8A16; color: white; font-weight: bold; }
+        table.plain { width: 100%; }
+        table.plain td { border: none; text-align: center; width: 33%; }
+        .footer { font-size: 10pt; margin-top: 20pt; }
+    """
+    
+    BILL_TEMPLATE = (
+        "<h1>राजस्थान सरकार<br/>लोक निर्माण विभाग<br/>Government of Rajasthan<br/>Public Works Department</h1>"
+        "<h2>BILL NO: {bill_number}</h2>"
+        "{details}{work_description}{items}{deductions}{summary}"
+        "<table class='plain'><tr><td>Contractor Signature</td><td>Assistant Engineer</td><td>Executive Engineer</td></tr>"
+        "<tr><td>____________________</td><td>____________________</td><td>____________________</td></tr></table>"
+        "<p class='footer'>Generated on: {generated_on}<br/>PWD Tools - Bill Generator</p>"
+    )
+    
+    EMD_TEMPLATE = (
+        "<h1>राजस्थान सरकार<br/>लोक निर्माण विभाग<br/>EMD REFUND CERTIFICATE</h1>"
+        "{details}{calculation}"
+        "<p>This is to certify that the above EMD refund has been calculated correctly and is approved for payment.</p>"
+        "<table class='plain'><tr><td>Accounts Officer</td><td>Assistant Engineer</td><td>Executive Engineer</td></tr>"
+        "<tr><td>_______________</td><td>_______________</td><td>_______________</td></tr>"
+        "<tr><td>Date: _________</td><td>Date: _________</td><td>Date: _________</td></tr></table>"
+        "<p class='footer'>Generated on: {generated_on}<br/>PWD Tools - EMD Refund Calculator</p>"
+    )
+    
+    PROJECT_TEMPLATE = (
+        "<h1>PROJECT FINANCIAL REPORT<br/>PWD - Public Works Department</h1>"
+        "{details}{progress}"
+        "<p class='footer'>Report Generated on: {generated_on}<br/>PWD Tools - Financial Analysis Module</p>"
+    )
+    
+    def __init__(self):
+        """Initialize PyMuPDF generator"""
+        if not PYMUPDF_AVAILABLE:
+            raise ImportError("PyMuPDF is required for this PDF backend. Install with: pip install pymupdf")
         
-        if output_path is None:
-            buffer.seek(0)
-            return buffer.getvalue()
+        self._fitz = importlib.import_module('pymupdf')
+    
+    @staticmethod
+    def _details_table(rows, total_last=False):
+        """Render label/value pairs as an HTML table"""
+        cells = [
+            f"<tr><td class='label'>{html.escape(str(label))}</td><td>{html.escape(str(value))}</td></tr>"
+            for label, value in rows
+        ]
+        if total_last and cells:
+            cells[-1] = cells[-1].replace("<tr>", "<tr class='total'>", 1)
+        return f"<table>{''.join(cells)}</table>"
+    
+    @staticmethod
+    def _grid_table(header, rows, total_last=False):
+        """Render a header row plus data rows as an HTML table"""
+        parts = ["<table><tr>", "".join(f"<th>{html.escape(h)}</th>" for h in header), "</tr>"]
+        for i, row in enumerate(rows, 1):
+            parts.append("<tr class='total'>" if total_last and i == len(rows) else "<tr>")
+            parts.extend(f"<td>{html.escape(str(value))}</td>" for value in row)
+            parts.append("</tr>")
+        parts.append("</table>")
+        return "".join(parts)
+    
+    def _render(self, body, fp):
+        """Flow the HTML body over as many A4 pages as it needs"""
+        fitz = self._fitz
+        story = fitz.Story(html=body, user_css=self.CSS)
+        writer = fitz.DocumentWriter(fp)
+        page_rect = fitz.Rect(self.PAGE_RECT)
+        content_rect = fitz.Rect(self.CONTENT_RECT)
+        more = True
+        while more:
+            device = writer.begin_page(page_rect)
+            more, _ = story.place(content_rect)
+            story.draw(device)
+            writer.end_page()
+        writer.close()
+    
+    def _to_output(self, body, output_path):
+        """Write to output_path, or return the PDF bytes when no path is given"""
+        if output_path is not None:
+            self._render(body, output_path)
+            return output_path
+        
+        buffer = io.BytesIO()
+        self._render(body, buffer)
+        return buffer.getvalue()
+    
+    def _bill_html(self, bill_data):
+        """Build the HTML for a bill document"""
+        bill_amount = bill_data.get('bill_amount', 0)
+        deductions = bill_data.get('deductions') or []
+        total_deductions = sum(d.get('amount', 0) for d in deductions)
+        net_amount = bill_amount - total_deductions
+        
+        details = self._details_table([
+            ('Bill Date:', bill_data.get('bill_date', 'N/A')),
+            ('Contractor Name:', bill_data.get('contractor_name', 'N/A')),
+            ('Project Name:', bill_data.get('project_name', 'N/A')),
+            ('Work Order No.:', bill_data.get('work_order_no', 'N/A')),
+            ('Agreement Amount:', f"₹{bill_data.get('agreement_amount', 0):,.2f}"),
+            ('Bill Amount:', f"₹{bill_amount:,.2f}")
+        ])
+        
+        work_description = ""
+        if bill_data.get('work_description'):
+            work_description = f"<p><b>Work Description:</b><br/>{html.escape(str(bill_data['work_description']))}</p>"
+        
+        items = ""
+        if bill_data.get('items'):
+            items = "<h2>Bill Items</h2>" + self._grid_table(
+                ['S.No.', 'Description', 'Unit', 'Quantity', 'Rate (₹)', 'Amount (₹)'],
+                [
+                    [
+                        str(i),
+                        item.get('description', ''),
+                        item.get('unit', ''),
+                        f"{item.get('quantity', 0):.2f}",
+                        f"{item.get('rate', 0):,.2f}",
+                        f"{item.get('total', 0):,.2f}"
+                    ]
+                    for i, item in enumerate(bill_data['items'], 1)
+                ]
+            )
         
-        return output_path
+        deductions_html = ""
+        if deductions:
+            rows = []
+            for deduction in deductions:
+                rate = deduction.get('rate', 0)
+                rows.append([
+                    deduction.get('type', ''),
+                    f"{rate:.2f}%" if rate > 0 else 'Fixed',
+                    f"{deduction.get('amount', 0):,.2f}"
+                ])
+            rows.append(['Total Deductions', '', f"{total_deductions:,.2f}"])
+            deductions_html = "<h2>Deductions</h2>" + self._grid_table(
+                ['Deduction Type', 'Rate (%)', 'Amount (₹)'], rows, total_last=True
+            )
+        
+        summary = self._details_table([
+            ('Bill Amount:', f"₹{bill_amount:,.2f}"),
+            ('Total Deductions:', f"₹{total_deductions:,.2f}"),
+            ('Net Payable Amount:', f"₹{net_amount:,.2f}")
+        ], total_last=True)
+        
+        return self.BILL_TEMPLATE.format_map({
+            'bill_number': html.escape(str(bill_data.get('bill_number', 'N/A'))),
+            'details': details,
+            'work_description': work_description,
+            'items': items,
+            'deductions': deductions_html,
+            'summary': summary,
+            'generated_on': _generated_on()
+        })
+    
+    def _emd_html(self, emd_data):
+        """Build the HTML for an EMD refund certificate"""
+        emd_amount = emd_data.get('emd_amount', 0)
+        interest_rate = emd_data.get('interest_rate', 0)
+        interest_amount = emd_data.get('interest_amount', 0)
+        total_refund = emd_data.get('total_refund', 0)
+        days_held = emd_data.get('days_held', 0)
+        
+        details = self._details_table([
+            ('Tender Number:', emd_data.get('tender_number', 'N/A')),
+            ('Contractor/Bidder Name:', emd_data.get('contractor_name', 'N/A')),
+            ('EMD Amount:', f"₹{emd_amount:,.2f}"),
+            ('Deposit Date:', emd_data.get('deposit_date', 'N/A')),
+            ('Refund Date:', emd_data.get('refund_date', 'N/A')),
+            ('Interest Rate:', f"{interest_rate:.2f}% per annum"),
+            ('Interest Amount:', f"₹{interest_amount:,.2f}"),
+            ('Total Refund Amount:', f"₹{total_refund:,.2f}")
+        ], total_last=True)
+        
+        calculation = ""
+        if days_held:
+            calculation = (
+                f"<p><b>Calculation Details:</b><br/>"
+                f"EMD Amount: ₹{emd_amount:,.2f}<br/>"
+                f"Days Held: {days_held} days<br/>"
+                f"Interest Calculation: ₹{emd_amount:,.2f} × {interest_rate:.2f}% × {days_held}/365<br/>"
+                f"Interest Amount: ₹{interest_amount:,.2f}<br/>"
+                f"Total Refund: ₹{total_refund:,.2f}</p>"
+            )
+        
+        return self.EMD_TEMPLATE.format_map({
+            'details': details,
+            'calculation': calculation,
+            'generated_on': _generated_on()
+        })
+    
+    def _project_html(self, project_data):
+        """Build the HTML for a project financial report"""
+        details = self._details_table([
+            ('Project Name:', project_data.get('project_name', 'N/A')),
+            ('Project Code:', project_data.get('project_code', 'N/A')),
+            ('Contractor Name:', project_data.get('contractor_name', 'N/A')),
+            ('Agreement Amount:', f"₹{project_data.get('agreement_amount', 0):,.2f}"),
+            ('Work Done Amount:', f"₹{project_data.get('work_done_amount', 0):,.2f}"),
+            ('Payments Made:', f"₹{project_data.get('payments_made', 0):,.2f}"),
+            ('Outstanding Amount:', f"₹{project_data.get('outstanding_amount', 0):,.2f}")
+        ])
+        
+        progress = ""
+        if 'physical_progress' in project_data:
+            progress = "<h2>Progress Summary</h2>" + self._details_table([
+                ('Physical Progress:', f"{project_data.get('physical_progress', 0):.1f}%"),
+                ('Financial Progress:', f"{project_data.get('financial_progress', 0):.1f}%"),
+                ('Time Progress:', f"{project_data.get('time_progress', 0):.1f}%")
+            ])
+        
+        return self.PROJECT_TEMPLATE.format_map({
+            'details': details,
+            'progress': progress,
+            'generated_on': _generated_on()
+        })
+    
+    def create_bill_pdf(self, bill_data, output_path=None):
+        """Generate PDF for bill document"""
+        return self._to_output(self._bill_html(bill_data), output_path)
+    
+    def create_bill_pdf_stream(self, bill_data, fp):
+        """Write the bill PDF straight to a file-like object or path"""
+        self._render(self._bill_html(bill_data), fp)
+    
+    def create_emd_refund_pdf(self, emd_data, output_path=None):
+        """Generate PDF for EMD refund certificate"""
+        return self._to_output(self._emd_html(emd_data), output_path)
+    
+    def create_emd_refund_pdf_stream(self, emd_data, fp):
+        """Write the EMD refund certificate straight to a file-like object or path"""
+        self._render(self._emd_html(emd_data), fp)
+    
+    def create_project_report_pdf(self, project_data, output_path=None):
+        """Generate PDF for project financial report"""
+        return self._to_output(self._project_html(project_data), output_path)
+    
+    def create_project_report_pdf_stream(self, project_data, fp):
+        """Write the project financial report straight to a file-like object or path"""
+        self._render(self._project_html(project_data), fp)
 
 # Fallback class if ReportLab is not available
 class PDFGeneratorFallback:
     """Fallback PDF generator when ReportLab is not available"""
+    __slots__ = ('available',)
     
     def __init__(self):
         self.available = False
     
-    def create_bill_pdf(self, bill_data, output_path=None):
-        raise NotImplementedError("PDF generation requires ReportLab. Install with: pip install reportlab")
-    
-    def create_emd_refund_pdf(self, emd_data, output_path=None):
-        raise NotImplementedError("PDF generation requires ReportLab. Install with: pip install reportlab")
-    
-    def create_project_report_pdf(self, project_data, output_path=None):
-        raise NotImplementedError("PDF generation requires ReportLab. Install with: pip install reportlab")
+    def __getattr__(self, name):
+        """Make every create_*_pdf / create_*_pdf_stream method raise NotImplementedError"""
+        if name.startswith('create_') and name.endswith(('_pdf', '_pdf_stream')):
+            def _unavailable(*args, **kwargs):
+                raise NotImplementedError("PDF generation requires ReportLab. Install with: pip install reportlab")
+            return _unavailable
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
 # Factory function
 def get_pdf_generator():
     """Get PDF generator instance"""
+    # PWD_PDF_BACKEND=pymupdf selects the PyMuPDF backend when it is installed
+    if os.environ.get('PWD_PDF_BACKEND', '').lower() == 'pymupdf' and PYMUPDF_AVAILABLE:
+        return PDFGeneratorPyMuPDF()
     if REPORTLAB_AVAILABLE:
         return PDFGenerator()
     else:
         return PDFGeneratorFallback()
 
-# Utility functions for text-based reports (always available)
-def generate_text_bill_report(bill_data):
-    """Generate text-based bill report"""
-    report = f"""
-PWD BILL REPORT
-===============
+# Generator used by each build_bills_parallel worker process
+_worker_generator = None
 
-Bill Number: {bill_data.get('bill_number', 'N/A')}
-Bill Date: {bill_data.get('bill_date', 'N/A')}
-Contractor: {bill_data.get('contractor_name', 'N/A')}
-Project: {bill_data.get('project_name', 'N/A')}
+def _init_bill_worker():
+    """Create one generator per worker so styles and fonts are set up once"""
+    global _worker_generator
+    _worker_generator = get_pdf_generator()
 
-FINANCIAL DETAILS:
-Bill Amount: ₹{bill_data.get('bill_amount', 0):,.2f}
-Total Deductions: ₹{sum([d.get('amount', 0) for d in bill_data.get('deductions', [])]):,.2f}
-Net Payable: ₹{bill_data.get('bill_amount', 0) - sum([d.get('amount', 0) for d in bill_data.get('deductions', [])]):,.2f}
+def _build_bill_file(bill_data, output_path):
+    """Write a single bill PDF inside a worker process"""
+    return _worker_generator.create_bill_pdf(bill_data, output_path)
 
-Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
-PWD Tools - Bill Generator
-"""
-    return report
+def _bill_file_name(index, bill_data):
+    """File name for a bill PDF; bill numbers like B001/2024 are made path-safe"""
+    safe_number = re.sub(r'[^\w.-]', '_', str(bill_data.get('bill_number') or 'bill'))
+    # The index keeps names unique when bill numbers repeat
+    return f"{index:04d}_{safe_number}.pdf"
 
-def generate_text_emd_report(emd_data):
-    """Generate text-based EMD refund report"""
-    report = f"""
-EMD REFUND CERTIFICATE
-=====================
+def build_bills_parallel(bill_dicts, out_dir, workers=None):
+    """Generate one PDF per bill across worker processes and return the file paths"""
+    os.makedirs(out_dir, exist_ok=True)
+    output_paths = [
+        os.path.join(out_dir, _bill_file_name(index, bill_data))
+        for index, bill_data in enumerate(bill_dicts, 1)
+    ]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_bill_worker) as executor:
+        return list(executor.map(_build_bill_file, bill_dicts, output_paths))
 
-Tender Number: {emd_data.get('tender_number', 'N/A')}
-Contractor: {emd_data.get('contractor_name', 'N/A')}
-EMD Amount: ₹{emd_data.get('emd_amount', 0):,.2f}
-Interest Rate: {emd_data.get('interest_rate', 0):.2f}% per annum
-Total Refund: ₹{emd_data.get('total_refund', 0):,.2f}
+# Utility functions for text-based reports (always available)
+def generate_text_bill_report(bill_data):
+    """Generate text-based bill report"""
+    bill_amount = bill_data.get('bill_amount', 0)
+    total_deductions = sum(d.get('amount', 0) for d in bill_data.get('deductions') or [])
+    net_amount = bill_amount - total_deductions
+    
+    parts = [
+        "",
+        "PWD BILL REPORT",
+        "===============",
+        "",
+        f"Bill Number: {bill_data.get('bill_number', 'N/A')}",
+        f"Bill Date: {bill_data.get('bill_date', 'N/A')}",
+        f"Contractor: {bill_data.get('contractor_name', 'N/A')}",
+        f"Project: {bill_data.get('project_name', 'N/A')}",
+        "",
+        "FINANCIAL DETAILS:",
+        f"Bill Amount: ₹{bill_amount:,.2f}",
+        f"Total Deductions: ₹{total_deductions:,.2f}",
+        f"Net Payable: ₹{net_amount:,.2f}",
+        "",
+        f"Generated on: {_generated_on()}",
+        "PWD Tools - Bill Generator",
+        "",
+    ]
+    return "\n".join(parts)
 
-Generated on: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}
-PWD Tools - EMD Refund Calculator
-"""
-    return report
+def generate_text_emd_report(emd_data):
+    """Generate text-based EMD refund report"""
+    parts = [
+        "",
+        "EMD REFUND CERTIFICATE",
+        "=====================",
+        "",
+        f"Tender Number: {emd_data.get('tender_number', 'N/A')}",
+        f"Contractor: {emd_data.get('contractor_name', 'N/A')}",
+        f"EMD Amount: ₹{emd_data.get('emd_amount', 0):,.2f}",
+        f"Interest Rate: {emd_data.get('interest_rate', 0):.2f}% per annum",
+        f"Total Refund: ₹{emd_data.get('total_refund', 0):,.2f}",
+        "",
+        f"Generated on: {_generated_on()}",
+        "PWD Tools - EMD Refund Calculator",
+        "",
+    ]
+    return "\n".join(parts)